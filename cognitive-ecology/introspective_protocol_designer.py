@@ -7,11 +7,28 @@ architecture that embodies the peace->war and core->edge dynamics.
 """
 
 import asyncio
+import copy
 import json
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, TypedDict
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 import hashlib
+import time
+
+
+# Upper bound on completed designs kept for repeat requests
+DESIGN_RESULT_CACHE_SIZE = 128
+
+
+class DesignRequest(TypedDict, total=False):
+    """Shape of a protocol design request"""
+    name: str
+    purpose: str
+    functional_requirements: Dict[str, Any]
+    non_functional_requirements: Dict[str, Any]
+    environmental_constraints: Dict[str, Any]
+    collaboration_requirements: List[str]
 
 
 @dataclass
@@ -47,6 +64,8 @@ class IntrospectiveProtocolDesigner:
         self.evolution_engine = None
         self.design_patterns = {}
         self.meta_protocols = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._design_result_cache: "OrderedDict[str, ProtocolOrganism]" = OrderedDict()
         
     async def initialize_meta_protocol_system(self):
         """Initialize the meta-protocol system for self-design"""
@@ -206,8 +225,72 @@ class IntrospectiveProtocolDesigner:
         return evolution_protocol
     
     async def design_protocol_using_introspection(self, 
-                                                design_request: Dict[str, Any]) -> ProtocolOrganism:
-        """Use introspection to design a new protocol"""
+                                                design_request: DesignRequest) -> ProtocolOrganism:
+        """Use introspection to design a new protocol
+        
+        Identical concurrent requests are coalesced onto a single run of the
+        design pipeline, and completed designs are served from a bounded cache.
+        Cancelling a waiting caller does not affect the shared run; if the caller
+        running the pipeline is cancelled, a waiting caller starts it again.
+        The caller that ran the pipeline gets the registered organism; cache hits
+        and coalesced callers each get their own deep copy of it.
+        """
+        
+        request_key = self._design_request_key(design_request)
+        
+        while True:
+            cached = self._design_result_cache.get(request_key)
+            if cached is not None:
+                self._design_result_cache.move_to_end(request_key)
+                return copy.deepcopy(cached)
+            
+            inflight = self._inflight.get(request_key)
+            if inflight is None:
+                break
+            try:
+                # Shielded so cancelling one waiter leaves the shared future (and
+                # every other waiter) untouched
+                return copy.deepcopy(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                # Only the leader was cancelled, not this caller: take over the design
+                if not inflight.cancelled():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[request_key] = future
+        try:
+            new_protocol = await self._run_design_pipeline(design_request)
+        except asyncio.CancelledError:
+            if not future.done():
+                future.cancel()
+            raise
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # Mark as retrieved so an unobserved failure is not logged twice
+                future.exception()
+            raise
+        else:
+            # Snapshot before returning, so changes to the leader's organism do
+            # not leak into other callers' results
+            snapshot = copy.deepcopy(new_protocol)
+            if not future.done():
+                future.set_result(snapshot)
+            self._design_result_cache[request_key] = snapshot
+            if len(self._design_result_cache) > DESIGN_RESULT_CACHE_SIZE:
+                self._design_result_cache.popitem(last=False)
+            return new_protocol
+        finally:
+            del self._inflight[request_key]
+    
+    @staticmethod
+    def _design_request_key(design_request: DesignRequest) -> str:
+        """Canonical hash of a design request, independent of key order"""
+        canonical = json.dumps(design_request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    async def _run_design_pipeline(self, design_request: DesignRequest) -> ProtocolOrganism:
+        """Run the full introspective design pipeline for a single request"""
         
         # Step 1: Analyze the design request using meta-protocol
         requirements = await self._introspective_requirement_analysis(design_request)
@@ -237,7 +320,7 @@ class IntrospectiveProtocolDesigner:
         
         return new_protocol
     
-    async def _introspective_requirement_analysis(self, design_request: Dict[str, Any]) -> Dict[str, Any]:
+    async def _introspective_requirement_analysis(self, design_request: DesignRequest) -> Dict[str, Any]:
         """Use protocol designer protocol to analyze requirements"""
         
         designer_protocol = self.meta_protocols["protocol_designer"]
@@ -248,11 +331,12 @@ class IntrospectiveProtocolDesigner:
             if gene.function == "analyze_design_requirements"
         )
         
+        get = design_request.get
         analysis_results = {
-            "functional_requirements": self._extract_functional_requirements(design_request),
-            "non_functional_requirements": self._extract_nonfunctional_requirements(design_request),
-            "environmental_constraints": self._analyze_environmental_constraints(design_request),
-            "collaboration_needs": self._identify_collaboration_needs(design_request),
+            "functional_requirements": get("functional_requirements", {}),
+            "non_functional_requirements": get("non_functional_requirements", {}),
+            "environmental_constraints": get("environmental_constraints", {}),
+            "collaboration_needs": get("collaboration_requirements", []),
             "evolution_requirements": self._plan_evolution_requirements(design_request),
             "meta_properties": {
                 "introspection_depth": requirement_gene.parameters.get("context_depth", "medium"),
@@ -339,7 +423,8 @@ class IntrospectiveProtocolDesigner:
         """Create ecosystem where protocols collaborate to design new protocols"""
         
         ecosystem = {
-            "ecosystem_id": f"collaborative_design_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            "ecosystem_id": f"collaborative_design_{time.time_ns():x}",
+            "created_at": datetime.now(timezone.utc).isoformat(),
             "participating_protocols": participating_protocols,
             "collaboration_topology": await self._design_collaboration_topology(participating_protocols),
             "shared_gene_pool": await self._create_shared_gene_pool(participating_protocols),
@@ -356,18 +441,6 @@ class IntrospectiveProtocolDesigner:
         return ecosystem
     
     # Helper methods for introspective protocol design
-    def _extract_functional_requirements(self, request): 
-        return request.get("functional_requirements", {})
-    
-    def _extract_nonfunctional_requirements(self, request):
-        return request.get("non_functional_requirements", {})
-        
-    def _analyze_environmental_constraints(self, request):
-        return request.get("environmental_constraints", {})
-        
-    def _identify_collaboration_needs(self, request):
-        return request.get("collaboration_requirements", [])
-        
     def _plan_evolution_requirements(self, request):
         return {"evolution_strategy": "adaptive", "mutation_rate": 0.1}
     
@@ -424,7 +497,7 @@ async def demonstrate_introspective_protocol_design():
     await designer.initialize_meta_protocol_system()
     
     # Design request for a new collaboration protocol
-    design_request = {
+    design_request: DesignRequest = {
         "name": "Multi-Agent Cognitive Collaboration Protocol",
         "purpose": "Enable seamless collaboration between different AI cognitive architectures",
         "functional_requirements": {
@@ -8,47 +8,318 @@ builds of AI models, protocols, and entire cognitive ecosystems.
 
 import json
 import hashlib
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
-import subprocess
+import functools
+import sqlite3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Mapping, Set, Iterable, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import datetime, timezone
 import os
 
+# Only used for blueprint output; identity hashes always use the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Content-identity hash for source hashes and manifest ids. There is no
+# adversary here, so BLAKE2b is used for speed; verification checksums stay
+# SHA-256. Manifest ids carry this prefix so consumers can tell the formats apart.
+_identity_hash = functools.partial(hashlib.blake2b, digest_size=32)
+MANIFEST_ID_PREFIX = "b2-"
+
+
+@dataclass(frozen=True, slots=True)
 class BuildComponent:
-    """A component in the build graph"""
+    """A component in the build graph
+    
+    Components are immutable: list inputs are stored as tuples and mappings as
+    read-only views, and the content digest is computed once at construction.
+    """
     name: str
     version: str
     source_hash: str
-    build_inputs: List[str]
-    build_outputs: List[str]
+    build_inputs: Tuple[str, ...]
+    build_outputs: Tuple[str, ...]
     build_system: str
-    configuration: Dict[str, Any]
-    environment_variables: Dict[str, str]
+    configuration: Mapping[str, Any]
+    environment_variables: Mapping[str, str]
+    # Cached hashing state; a digest passed in (e.g. restored from the
+    # persistent cache) is trusted instead of being recomputed
+    _digest: str = field(default="", repr=False, compare=False)
+    _view: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for name in ("build_inputs", "build_outputs"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+        for name in ("configuration", "environment_variables"):
+            value = getattr(self, name)
+            if not isinstance(value, MappingProxyType):
+                object.__setattr__(self, name, _freeze_mapping(value))
+        if not self._digest:
+            object.__setattr__(self, "_digest", _hash_component(self))
+    
+    def __hash__(self):
+        return hash(self._digest)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildManifest:
     """Complete manifest for a reproducible build"""
     manifest_id: str
     target_name: str
     target_version: str
     build_timestamp: str
-    components: List[BuildComponent]
+    components: Tuple[BuildComponent, ...]
     dependency_graph: Dict[str, List[str]]
     build_environment: Dict[str, Any]
     verification_checksums: Dict[str, str]
+    
+    def __post_init__(self):
+        object.__setattr__(self, "components", tuple(self.components))
+    
+    def __hash__(self):
+        return hash(self.manifest_id)
+
+
+def _freeze_mapping(mapping: Mapping[str, Any]) -> MappingProxyType:
+    """Read-only view over a private copy of a mapping"""
+    return MappingProxyType(dict(mapping))
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode read-only mappings (e.g. MappingProxyType) as plain objects"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """Deterministic JSON encoding used as hash input
+    
+    Always the stdlib encoder, whether or not orjson is installed: the two format
+    some floats differently (e.g. ``2e-05`` vs ``0.00002``), and source hashes,
+    component keys and manifest ids must not depend on the environment.
+    """
+    return json.dumps(
+        obj, default=_json_default, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def _feed(hasher: Any, value: Any) -> None:
+    """Feed a JSON-like value into a hash object without building a string
+    
+    Every value is tagged with its type and strings/containers are length
+    prefixed, so distinct structures can never produce the same byte stream.
+    """
+    if isinstance(value, str):
+        data = value.encode()
+        hasher.update(b"s%d:" % len(data))
+        hasher.update(data)
+    elif isinstance(value, Mapping):
+        hasher.update(b"m%d:" % len(value))
+        for key in sorted(value):
+            _feed(hasher, key)
+            _feed(hasher, value[key])
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"l%d:" % len(value))
+        for item in value:
+            _feed(hasher, item)
+    elif value is None:
+        hasher.update(b"n")
+    elif isinstance(value, bool):
+        hasher.update(b"t" if value else b"f")
+    elif isinstance(value, (int, float)):
+        hasher.update(b"d%r;" % value)
+    elif isinstance(value, bytes):
+        hasher.update(b"b%d:" % len(value))
+        hasher.update(value)
+    else:
+        raise TypeError(f"Cannot hash value of type {type(value).__name__}")
+
+
+def _hash_component(component: "BuildComponent") -> str:
+    """Digest of a component's public fields, streamed straight into the hasher"""
+    hasher = hashlib.sha256()
+    for f in fields(component):
+        if not f.name.startswith("_"):
+            _feed(hasher, f.name)
+            _feed(hasher, getattr(component, f.name))
+    return hasher.hexdigest()
+
+
+def _component_key(component: BuildComponent) -> str:
+    """Registry key of a component, as used in dependency graphs"""
+    return f"{component.name}-{component.version}-{component.source_hash[:8]}"
+
+
+def _component_view(component: BuildComponent) -> Dict[str, Any]:
+    """Plain-dict form of a component, built once and shared by every caller
+    
+    The same dict is referenced from the blueprint and from each manifest that
+    includes the component, so it must be treated as read-only.
+    """
+    if component._view is None:
+        object.__setattr__(component, "_view", {
+            f.name: _public_asdict(getattr(component, f.name))
+            for f in fields(component) if not f.name.startswith("_")
+        })
+    return component._view
+
+
+def _manifest_from_record(record: Dict[str, Any]) -> BuildManifest:
+    """Rebuild a BuildManifest (and its components) from its serialized form"""
+    return BuildManifest(**{
+        **record,
+        "components": [BuildComponent(**component) for component in record["components"]]
+    })
+
+
+def _public_asdict(obj: Any) -> Any:
+    """Like asdict(), but skips underscore-prefixed (cached) dataclass fields"""
+    if isinstance(obj, BuildComponent):
+        return _component_view(obj)
+    if is_dataclass(obj):
+        return {
+            f.name: _public_asdict(getattr(obj, f.name))
+            for f in fields(obj) if not f.name.startswith("_")
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_public_asdict(value) for value in obj]
+    if isinstance(obj, Mapping):
+        return {key: _public_asdict(value) for key, value in obj.items()}
+    return obj
+
+
+class PersistentBuildCache:
+    """SQLite-backed record of components, manifests and build results
+    
+    Lets a later run restore components and manifests whose inputs have not
+    changed since they were last generated or built under the same store path,
+    instead of hashing and resolving them again.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS component_records (
+                spec_key TEXT PRIMARY KEY,
+                component TEXT NOT NULL,
+                digest TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS manifest_records (
+                manifest_key TEXT PRIMARY KEY,
+                record TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS component_builds (
+                component_key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                result TEXT NOT NULL
+            );
+        """)
+    
+    def get_component(self, spec_key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return the fields and digest of the component previously defined from a spec"""
+        row = self._db.execute(
+            "SELECT component, digest FROM component_records WHERE spec_key = ?",
+            (spec_key,)
+        ).fetchone()
+        return (json.loads(row[0]), row[1]) if row is not None else None
+    
+    def put_component(self, spec_key: str, component: BuildComponent):
+        view = _component_view(component)
+        encoded = json.dumps(view)
+        # The stored digest is trusted on restore, so only record components
+        # that JSON reproduces exactly (e.g. not ones with int mapping keys)
+        if json.loads(encoded) != view:
+            return
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO component_records VALUES (?, ?, ?)",
+                (spec_key, encoded, component._digest)
+            )
+    
+    def get_manifest(self, manifest_key: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded manifest for a set of targets and build config"""
+        row = self._db.execute(
+            "SELECT record FROM manifest_records WHERE manifest_key = ?",
+            (manifest_key,)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+    
+    def put_manifest(self, manifest_key: str, record: Dict[str, Any]):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO manifest_records VALUES (?, ?)",
+                (manifest_key, json.dumps(record, default=_json_default))
+            )
+    
+    def load_builds(self) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """Return {component key: (digest, build result)} of the last successful builds"""
+        return {
+            key: (digest, json.loads(result))
+            for key, digest, result in self._db.execute("SELECT * FROM component_builds")
+        }
+    
+    def put_build(self, component_key: str, digest: str, result: Dict[str, Any]):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO component_builds VALUES (?, ?, ?)",
+                (component_key, digest, json.dumps(result))
+            )
+    
+    def close(self):
+        self._db.close()
 
 
 class ReproducibleAIBuilder:
     """Guix-inspired reproducible build system for AI components"""
     
-    def __init__(self, store_path: str = "/nix/store"):
+    # Build environment defaults; shared, immutable, and overridden per manifest
+    _DEFAULT_ENV = MappingProxyType({
+        "base_image": "ubuntu:22.04",
+        "python_version": "3.11",
+        "system_packages": (),
+        "environment_variables": MappingProxyType({}),
+        "build_tools": ("gcc", "make", "cmake"),
+        "isolation_level": "container"
+    })
+    
+    def __init__(self, store_path: str = "/nix/store", persistent_cache: bool = False):
         self.store_path = store_path
+        self.persistent_cache = persistent_cache
         self.component_registry = {}
-        self.build_cache = {}
         self.environment_specifications = {}
+        self._spec_cache: Dict[bytes, BuildComponent] = {}
+        # Frozen build inputs/configuration shared between equal components
+        self._interned: Dict[Tuple[Any, bytes], Any] = {}
+        # Materialized scenario manifests by manifest id
+        self._manifests: Dict[str, BuildManifest] = {}
+        self._persistent_cache = self._open_persistent_cache()
+        # Last successful build per component key: (digest, build result)
+        self.build_cache: Dict[str, Tuple[str, Dict[str, Any]]] = (
+            self._persistent_cache.load_builds() if self._persistent_cache is not None else {}
+        )
+        
+    def _open_persistent_cache(self) -> Optional[PersistentBuildCache]:
+        """Open the on-disk cache if requested and the store path is a writable directory"""
+        if not self.persistent_cache:
+            return None
+        if not (os.path.isdir(self.store_path) and os.access(self.store_path, os.W_OK)):
+            return None
+        return PersistentBuildCache(os.path.join(self.store_path, "build-cache.sqlite"))
+    
+    def close(self):
+        """Release the on-disk cache, if one is open"""
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
+            self._persistent_cache = None
         
     def define_build_component(self, 
                              name: str,
@@ -58,31 +329,87 @@ class ReproducibleAIBuilder:
         """Define a reproducible build component"""
         
         # Calculate source hash for reproducibility
-        source_content = json.dumps(source_specification, sort_keys=True)
-        source_hash = hashlib.sha256(source_content.encode()).hexdigest()
+        source_content = _canonical_json(source_specification)
+        source_hash = _identity_hash(source_content).hexdigest()
         
         component = BuildComponent(
             name=name,
             version=version,
             source_hash=source_hash,
-            build_inputs=build_procedure.get("inputs", []),
-            build_outputs=build_procedure.get("outputs", []),
+            build_inputs=self._intern(build_procedure.get("inputs", ()), tuple),
+            build_outputs=build_procedure.get("outputs", ()),
             build_system=build_procedure.get("build_system", "generic"),
-            configuration=build_procedure.get("configuration", {}),
-            environment_variables=build_procedure.get("environment", {})
+            configuration=self._intern(build_procedure.get("configuration", {}), _freeze_mapping),
+            environment_variables=self._intern(build_procedure.get("environment", {}), _freeze_mapping)
         )
         
-        component_key = f"{name}-{version}-{source_hash[:8]}"
-        self.component_registry[component_key] = component
+        self.component_registry[_component_key(component)] = component
         
         return component
     
+    def _intern(self, value: Any, freeze) -> Any:
+        """Return one shared frozen instance for all structurally equal values
+        
+        Keyed on a type-tagged digest rather than JSON, so values that only
+        encode alike (e.g. ``{1: x}`` and ``{"1": x}``) are kept apart.
+        """
+        hasher = _identity_hash()
+        _feed(hasher, value)
+        key = (freeze, hasher.digest())
+        frozen = self._interned.get(key)
+        if frozen is None:
+            frozen = self._interned[key] = freeze(value)
+        return frozen
+    
+    def _make_component(self,
+                        kind: str,
+                        name: str,
+                        version: str,
+                        source_specification: Dict[str, Any],
+                        build_procedure: Dict[str, Any]) -> BuildComponent:
+        """Define a component, reusing the existing one for an identical spec"""
+        
+        # Type-tagged like _intern(), so specs that only differ in key types
+        # (e.g. ``{1: x}`` and ``{"1": x}``) get distinct components
+        hasher = hashlib.blake2b(digest_size=16)
+        _feed(hasher, [kind, name, version, source_specification, build_procedure])
+        spec_key = hasher.digest()
+        
+        component = self._spec_cache.get(spec_key)
+        if component is None:
+            # A component defined from the same spec in an earlier run is restored
+            # with its digest, skipping the source and component hashing
+            cache = self._persistent_cache
+            record = cache.get_component(spec_key.hex()) if cache is not None else None
+            if record is not None:
+                component = self._restore_component(*record)
+                self.component_registry[_component_key(component)] = component
+            else:
+                component = self.define_build_component(
+                    name, version, source_specification, build_procedure
+                )
+                if cache is not None:
+                    cache.put_component(spec_key.hex(), component)
+            self._spec_cache[spec_key] = component
+        
+        return component
+    
+    def _restore_component(self, component_fields: Dict[str, Any], digest: str) -> BuildComponent:
+        """Rebuild a recorded component with its digest, sharing interned values"""
+        return BuildComponent(**{
+            **component_fields,
+            "build_inputs": self._intern(component_fields["build_inputs"], tuple),
+            "configuration": self._intern(component_fields["configuration"], _freeze_mapping),
+            "environment_variables": self._intern(component_fields["environment_variables"], _freeze_mapping)
+        }, _digest=digest)
+    
     def create_ml_model_component(self, 
                                 model_name: str,
                                 model_config: Dict[str, Any]) -> BuildComponent:
         """Create a reproducible ML model component"""
         
-        return self.define_build_component(
+        return self._make_component(
+            kind="model",
             name=model_name,
             version=model_config.get("version", "1.0.0"),
             source_specification={
@@ -121,7 +448,8 @@ class ReproducibleAIBuilder:
                                 protocol_spec: Dict[str, Any]) -> BuildComponent:
         """Create a reproducible protocol implementation component"""
         
-        return self.define_build_component(
+        return self._make_component(
+            kind="protocol",
             name=protocol_name,
             version=protocol_spec.get("version", "1.0.0"),
             source_specification={
@@ -160,7 +488,8 @@ class ReproducibleAIBuilder:
                                               architecture_spec: Dict[str, Any]) -> BuildComponent:
         """Create a reproducible cognitive architecture component"""
         
-        return self.define_build_component(
+        return self._make_component(
+            kind="architecture",
             name=architecture_name,
             version=architecture_spec.get("version", "1.0.0"),
             source_specification={
@@ -198,8 +527,26 @@ class ReproducibleAIBuilder:
     
     def generate_build_manifest(self, 
                               target_components: List[str],
-                              build_config: Dict[str, Any]) -> BuildManifest:
-        """Generate a complete build manifest for reproducible builds"""
+                              build_config: Dict[str, Any],
+                              build_timestamp: Optional[str] = None) -> BuildManifest:
+        """Generate a complete build manifest for reproducible builds
+        
+        ``build_timestamp`` lets callers share one snapshot across manifests or
+        pin it for bit-for-bit reproducible output; it defaults to now (UTC).
+        """
+        
+        build_timestamp = build_timestamp or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        
+        # Restore the manifest from a previous run when neither the inputs nor
+        # any component in its dependency graph changed
+        cache = self._persistent_cache
+        if cache is not None:
+            manifest_key = hashlib.blake2b(
+                _canonical_json([target_components, build_config]), digest_size=16
+            ).hexdigest()
+            manifest = self._restore_manifest(cache.get_manifest(manifest_key), build_config, build_timestamp)
+            if manifest is not None:
+                return manifest
         
         # Resolve dependency graph
         dependency_graph = self._resolve_dependency_graph(target_components)
@@ -213,39 +560,89 @@ class ReproducibleAIBuilder:
             if component_key in self.component_registry:
                 all_components.append(self.component_registry[component_key])
         
-        # Generate verification checksums
-        verification_checksums = self._generate_verification_checksums(all_components)
-        
         # Create build environment specification
         build_environment = self._create_build_environment(build_config)
         
-        manifest_content = {
+        # Components contribute their cached digests rather than being re-serialized
+        manifest_content = _canonical_json({
             "target_components": target_components,
             "build_config": build_config,
-            "components": [asdict(comp) for comp in all_components],
             "dependency_graph": dependency_graph,
             "build_environment": build_environment
-        }
-        
-        manifest_id = hashlib.sha256(
-            json.dumps(manifest_content, sort_keys=True).encode()
+        })
+        component_digests = "".join(sorted(component._digest for component in all_components))
+        manifest_id = MANIFEST_ID_PREFIX + _identity_hash(
+            manifest_content + component_digests.encode()
         ).hexdigest()
         
-        manifest = BuildManifest(
+        if cache is not None:
+            registry = self.component_registry
+            cache.put_manifest(manifest_key, {
+                "manifest_id": manifest_id,
+                # Digest of every node in the graph (None if unregistered), to
+                # tell whether the graph or any component changed since
+                "node_digests": {
+                    key: registry[key]._digest if key in registry else None
+                    for key in dependency_graph
+                },
+                "build_order": [_component_key(component) for component in all_components],
+                "dependency_graph": dependency_graph,
+                "build_environment": build_environment
+            })
+        
+        return self._make_manifest(
+            manifest_id, build_config, build_timestamp, all_components, dependency_graph, build_environment
+        )
+    
+    def _restore_manifest(self,
+                          record: Optional[Dict[str, Any]],
+                          build_config: Dict[str, Any],
+                          build_timestamp: str) -> Optional[BuildManifest]:
+        """Rebuild a recorded manifest, or return None if any of its components changed"""
+        if record is None:
+            return None
+        
+        registry = self.component_registry
+        for key, digest in record["node_digests"].items():
+            component = registry.get(key)
+            if (component._digest if component is not None else None) != digest:
+                return None
+        
+        return self._make_manifest(
+            record["manifest_id"], build_config, build_timestamp,
+            [registry[key] for key in record["build_order"]],
+            record["dependency_graph"], record["build_environment"]
+        )
+    
+    def _make_manifest(self,
+                       manifest_id: str,
+                       build_config: Dict[str, Any],
+                       build_timestamp: str,
+                       components: List[BuildComponent],
+                       dependency_graph: Dict[str, List[str]],
+                       build_environment: Dict[str, Any]) -> BuildManifest:
+        """Assemble a BuildManifest from its resolved parts"""
+        return BuildManifest(
             manifest_id=manifest_id,
             target_name=build_config.get("target_name", "ai_system"),
             target_version=build_config.get("target_version", "1.0.0"),
-            build_timestamp=datetime.now().isoformat(),
-            components=all_components,
+            build_timestamp=build_timestamp,
+            components=components,
             dependency_graph=dependency_graph,
             build_environment=build_environment,
-            verification_checksums=verification_checksums
+            verification_checksums=self._generate_verification_checksums(components)
         )
-        
-        return manifest
     
-    def execute_reproducible_build(self, manifest: BuildManifest) -> Dict[str, Any]:
-        """Execute a reproducible build based on manifest"""
+    def execute_reproducible_build(self,
+                                   manifest: BuildManifest,
+                                   incremental: bool = True) -> Dict[str, Any]:
+        """Execute a reproducible build based on manifest
+        
+        With ``incremental`` set, only components affected by a change since
+        their last successful build are rebuilt; the rest are restored from
+        the build cache. Component results are keyed by component key, so
+        several versions of one component are reported separately.
+        """
         
         build_results = {
             "manifest_id": manifest.manifest_id,
@@ -260,12 +657,13 @@ class ReproducibleAIBuilder:
             # Set up isolated build environment
             build_env = self._setup_build_environment(manifest.build_environment)
             
-            # Build components in dependency order
-            for component in manifest.components:
-                component_result = self._build_component(component, build_env)
-                build_results["component_results"][component.name] = component_result
+            affected = self.affected_components(manifest) if incremental else None
+            
+            # Build components in dependency waves; each wave builds concurrently
+            for wave_results in self._build_in_waves(manifest, build_env, affected):
+                build_results["component_results"].update(wave_results)
                 
-                if not component_result["success"]:
+                if not all(result["success"] for result in wave_results.values()):
                     build_results["build_status"] = "failed"
                     return build_results
             
@@ -284,6 +682,89 @@ class ReproducibleAIBuilder:
         
         return build_results
     
+    def affected_components(self, manifest: BuildManifest) -> Set[str]:
+        """Component keys that need rebuilding: changed ones and everything depending on them"""
+        components = {_component_key(component): component for component in manifest.components}
+        dependents = {key: [] for key in components}
+        for key in components:
+            for dependency in manifest.dependency_graph.get(key, ()):
+                if dependency in dependents:
+                    dependents[dependency].append(key)
+        
+        build_cache = self.build_cache
+        pending = deque(
+            key for key, component in components.items()
+            if build_cache.get(key, ("",))[0] != component._digest
+        )
+        affected = set()
+        while pending:
+            key = pending.popleft()
+            if key not in affected:
+                affected.add(key)
+                pending.extend(dependents[key])
+        
+        return affected
+    
+    def _build_in_waves(self,
+                        manifest: BuildManifest,
+                        build_env: Dict[str, Any],
+                        affected: Optional[Set[str]] = None):
+        """Yield build results wave by wave, following the dependency graph
+        
+        A wave holds every component whose in-manifest dependencies are already
+        built; its members are built concurrently. Results within a wave are
+        reported in manifest order. Components outside ``affected`` (when given)
+        are restored from the build cache instead of being rebuilt.
+        """
+        components = {_component_key(component): component for component in manifest.components}
+        remaining_deps = {key: 0 for key in components}
+        dependents = {key: [] for key in components}
+        for key in components:
+            for dependency in manifest.dependency_graph.get(key, ()):
+                if dependency in components:
+                    remaining_deps[key] += 1
+                    dependents[dependency].append(key)
+        
+        built = set()
+        ready = [key for key, count in remaining_deps.items() if count == 0]
+        
+        with ThreadPoolExecutor() as executor:
+            while ready:
+                futures = [
+                    (key, executor.submit(self._build_component, components[key], build_env)
+                     if affected is None or key in affected else None)
+                    for key in ready
+                ]
+                wave_results = {}
+                next_ready = []
+                for key, future in futures:
+                    component = components[key]
+                    if future is None:
+                        result = dict(self.build_cache[key][1], cached=True)
+                    else:
+                        result = future.result()
+                        if result["success"]:
+                            self._record_build(key, component, result)
+                    wave_results[key] = result
+                    built.add(key)
+                    for dependent in dependents[key]:
+                        remaining_deps[dependent] -= 1
+                        if remaining_deps[dependent] == 0:
+                            next_ready.append(dependent)
+                
+                yield wave_results
+                
+                # Components caught in a dependency cycle are built last
+                if not next_ready and len(built) < len(components):
+                    next_ready = [key for key in components if key not in built]
+                ready = next_ready
+    
+    def _record_build(self, component_key: str, component: BuildComponent, result: Dict[str, Any]):
+        """Remember a successful build so unchanged components can be restored later"""
+        self.build_cache[component_key] = (component._digest, result)
+        if self._persistent_cache is not None:
+            self._persistent_cache.put_build(component_key, component._digest, result)
+    
     def create_ai_system_blueprint(self, 
                                  system_name: str,
                                  system_specification: Dict[str, Any]) -> Dict[str, Any]:
@@ -298,99 +779,129 @@ class ReproducibleAIBuilder:
             "benchmark_suites": {}
         }
         
-        # Create ML model components
-        for model_spec in system_specification.get("models", []):
-            component = self.create_ml_model_component(
-                model_spec["name"], model_spec
-            )
-            blueprint["components"][f"model_{model_spec['name']}"] = asdict(component)
-        
-        # Create protocol components
-        for protocol_spec in system_specification.get("protocols", []):
-            component = self.create_protocol_component(
-                protocol_spec["name"], protocol_spec
-            )
-            blueprint["components"][f"protocol_{protocol_spec['name']}"] = asdict(component)
+        components = blueprint["components"]
+        manifests = blueprint["build_manifests"]
         
-        # Create cognitive architecture components
-        for arch_spec in system_specification.get("architectures", []):
-            component = self.create_cognitive_architecture_component(
-                arch_spec["name"], arch_spec
-            )
-            blueprint["components"][f"architecture_{arch_spec['name']}"] = asdict(component)
+        # Create ML model, protocol and cognitive architecture components
+        component_factories = (
+            ("model", "models", self.create_ml_model_component),
+            ("protocol", "protocols", self.create_protocol_component),
+            ("architecture", "architectures", self.create_cognitive_architecture_component),
+        )
+        for prefix, spec_section, create_component in component_factories:
+            for spec in system_specification.get(spec_section, ()):
+                name = spec["name"]
+                components[f"{prefix}_{name}"] = _component_view(create_component(name, spec))
         
-        # Generate build manifests for different deployment scenarios
+        # Record build manifests for different deployment scenarios; each one is
+        # only generated when first requested through get_manifest() (or by
+        # expand_manifests() before the blueprint is saved)
+        default_components = list(components)
+        build_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
         for scenario_name, scenario_config in system_specification.get("deployment_scenarios", {}).items():
-            target_components = scenario_config.get("components", list(blueprint["components"].keys()))
-            manifest = self.generate_build_manifest(target_components, scenario_config)
-            blueprint["build_manifests"][scenario_name] = asdict(manifest)
+            manifests[scenario_name] = {
+                "_lazy": True,
+                "target_components": scenario_config.get("components", default_components),
+                "config": scenario_config,
+                "build_timestamp": build_timestamp
+            }
         
         # Create benchmark suites
         blueprint["benchmark_suites"] = self._create_benchmark_suites(system_specification)
         
         return blueprint
     
-    def _resolve_dependency_graph(self, target_components: List[str]) -> Dict[str, List[str]]:
-        """Resolve the complete dependency graph"""
-        graph = {}
+    def get_manifest(self, blueprint: Dict[str, Any], scenario_name: str) -> BuildManifest:
+        """Return a scenario's build manifest, generating it on first access
         
-        def add_dependencies(component_key: str):
-            if component_key not in graph:
-                graph[component_key] = []
-                
-                if component_key in self.component_registry:
-                    component = self.component_registry[component_key]
-                    for dep in component.build_inputs:
-                        graph[component_key].append(dep)
-                        add_dependencies(dep)
+        The blueprint entry is replaced by the serialized manifest once it has
+        been generated, so later reads (and saved blueprints) see the full record.
+        """
+        manifests = blueprint["build_manifests"]
+        record = manifests[scenario_name]
         
-        for target in target_components:
-            add_dependencies(target)
+        if record.get("_lazy"):
+            manifest = self.generate_build_manifest(
+                record["target_components"], record["config"], record["build_timestamp"]
+            )
+            manifests[scenario_name] = _public_asdict(manifest)
+            self._manifests[manifest.manifest_id] = manifest
+            return manifest
         
-        return graph
+        manifest = self._manifests.get(record["manifest_id"])
+        if manifest is None:
+            manifest = _manifest_from_record(record)
+            self._manifests[manifest.manifest_id] = manifest
+        return manifest
     
-    def _topological_sort(self, dependency_graph: Dict[str, List[str]]) -> List[str]:
-        """Perform topological sort to determine build order"""
-        # Simplified topological sort implementation
-        visited = set()
-        result = []
+    def expand_manifests(self, blueprint: Dict[str, Any]):
+        """Generate every scenario manifest that has not been requested yet
         
-        def visit(node: str):
-            if node in visited:
-                return
-            visited.add(node)
-            
-            for dependency in dependency_graph.get(node, []):
-                visit(dependency)
+        Pending entries are in-memory placeholders, not part of the blueprint
+        format, so this must run before the blueprint is written to disk.
+        """
+        manifests = blueprint["build_manifests"]
+        for scenario_name in [name for name, record in manifests.items() if record.get("_lazy")]:
+            self.get_manifest(blueprint, scenario_name)
+    
+    def _resolve_dependency_graph(self, target_components: List[str]) -> Dict[str, List[str]]:
+        """Resolve the complete dependency graph (breadth-first, no recursion)"""
+        graph: Dict[str, Set[str]] = {}
+        seen = set()
+        pending = deque(target_components)
+        registry = self.component_registry
+        
+        while pending:
+            component_key = pending.popleft()
+            if component_key in seen:
+                continue
+            seen.add(component_key)
             
+            component = registry.get(component_key)
+            dependencies = component.build_inputs if component is not None else []
+            graph.setdefault(component_key, set()).update(dependencies)
+            pending.extend(dependencies)
+        
+        # Sorted adjacency keeps the graph (and thus the manifest id) deterministic
+        return {component_key: sorted(deps) for component_key, deps in graph.items()}
+    
+    def _topological_sort(self, dependency_graph: Mapping[str, Iterable[str]]) -> List[str]:
+        """Determine build order with Kahn's algorithm (dependencies first)"""
+        remaining_deps = {node: 0 for node in dependency_graph}
+        dependents = {node: [] for node in dependency_graph}
+        
+        for node, dependencies in dependency_graph.items():
+            for dependency in sorted(set(dependencies)):
+                if dependency in dependents:
+                    remaining_deps[node] += 1
+                    dependents[dependency].append(node)
+        
+        ready = deque(node for node, count in remaining_deps.items() if count == 0)
+        result = []
+        
+        while ready:
+            node = ready.popleft()
             result.append(node)
+            for dependent in dependents[node]:
+                remaining_deps[dependent] -= 1
+                if remaining_deps[dependent] == 0:
+                    ready.append(dependent)
         
-        for node in dependency_graph:
-            visit(node)
+        # Nodes caught in a cycle are appended in discovery order
+        if len(result) < len(dependency_graph):
+            ordered = set(result)
+            result.extend(node for node in dependency_graph if node not in ordered)
         
         return result
     
     def _generate_verification_checksums(self, components: List[BuildComponent]) -> Dict[str, str]:
         """Generate checksums for build verification"""
-        checksums = {}
-        
-        for component in components:
-            component_data = json.dumps(asdict(component), sort_keys=True)
-            checksum = hashlib.sha256(component_data.encode()).hexdigest()
-            checksums[component.name] = checksum
-        
-        return checksums
+        return {component.name: component._digest for component in components}
     
     def _create_build_environment(self, build_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create isolated build environment specification"""
-        return {
-            "base_image": build_config.get("base_image", "ubuntu:22.04"),
-            "python_version": build_config.get("python_version", "3.11"),
-            "system_packages": build_config.get("system_packages", []),
-            "environment_variables": build_config.get("environment_variables", {}),
-            "build_tools": build_config.get("build_tools", ["gcc", "make", "cmake"]),
-            "isolation_level": build_config.get("isolation_level", "container")
-        }
+        defaults = self._DEFAULT_ENV
+        return {**defaults, **{key: value for key, value in build_config.items() if key in defaults}}
     
     def _setup_build_environment(self, env_spec: Dict[str, Any]) -> Dict[str, Any]:
         """Set up the actual build environment"""
@@ -435,6 +946,36 @@ class ReproducibleAIBuilder:
         }
 
 
+def write_blueprint(blueprint: Dict[str, Any], path: str, pretty: bool = True):
+    """Serialize a blueprint to disk in one buffered write
+    
+    Both encoders write the same layout: indented by default, compact when
+    ``pretty`` is false. Non-string mapping keys are written as strings.
+    Scenario manifests must have been generated (see expand_manifests()).
+    """
+    pending = [
+        name for name, record in blueprint.get("build_manifests", {}).items() if record.get("_lazy")
+    ]
+    if pending:
+        raise ValueError(
+            f"Build manifests not generated yet: {', '.join(pending)}; "
+            "call ReproducibleAIBuilder.expand_manifests() before writing the blueprint"
+        )
+    
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        data = orjson.dumps(blueprint, default=_json_default, option=option)
+    elif pretty:
+        data = json.dumps(blueprint, default=_json_default, indent=2, ensure_ascii=False).encode()
+    else:
+        data = json.dumps(
+            blueprint, default=_json_default, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+    
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+
+
 def demonstrate_reproducible_ai_builds():
     """Demonstrate the Guix-inspired reproducible build system"""
     
@@ -531,11 +1072,11 @@ def demonstrate_reproducible_ai_builds():
     
     print("\n🚀 Deployment Scenarios:")
     for scenario_name, manifest_data in blueprint['build_manifests'].items():
-        print(f"  • {scenario_name}: {manifest_data['target_name']} ({len(manifest_data['components'])} components)")
+        print(f"  • {scenario_name}: {manifest_data['config'].get('target_name', 'ai_system')} "
+              f"({len(manifest_data['target_components'])} target components)")
     
-    # Demonstrate building the development scenario
-    dev_manifest_data = blueprint['build_manifests']['development']
-    dev_manifest = BuildManifest(**dev_manifest_data)
+    # Demonstrate building the development scenario; only its manifest is generated
+    dev_manifest = builder.get_manifest(blueprint, "development")
     
     print(f"\n🔨 Building Development Scenario:")
     print(f"Manifest ID: {dev_manifest.manifest_id}")
@@ -551,6 +1092,9 @@ def demonstrate_reproducible_ai_builds():
 if __name__ == "__main__":
     builder, blueprint, results = demonstrate_reproducible_ai_builds()
     
-    # Save blueprint to file
-    with open("/workspaces/aphroditecho/modproc/copilot-custom/cognitive-ecology/ai_system_blueprint.json", "w") as f:
-        json.dump(blueprint, f, indent=2)
+    # Save blueprint to file, with every scenario's manifest
+    builder.expand_manifests(blueprint)
+    write_blueprint(
+        blueprint,
+        "/workspaces/aphroditecho/modproc/copilot-custom/cognitive-ecology/ai_system_blueprint.json"
+    )
@@ -3,13 +3,114 @@ Demonstration: Cogpilot Custom Instructions in Action
 Living Architecture Intelligence for GitHub Enterprise Cognitive Ecology
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
-from dataclasses import dataclass
+import logging
+import threading
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
-@dataclass
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 768
+EMBEDDING_CACHE_SIZE = 1024
+MAX_CONCURRENT_TRANSPORTS = 16
+SWARM_SEED = 0  # Fixed so encodings (and the embedding cache) stay deterministic
+SWARM_SIZE = 10  # Small swarm for demonstration
+SWARM_ITERATIONS = 50
+# Stop early once the global best improves by less than the tolerance for `patience` iterations
+CONVERGENCE_TOLERANCE = 1e-6
+CONVERGENCE_PATIENCE = 5
+
+# Particle swarm coefficients: cognitive inertia + personal best + global best + org-level salience
+INERTIA_WEIGHT = 0.7
+COGNITIVE_WEIGHT = 1.4
+SOCIAL_WEIGHT = 1.4
+SALIENCE_WEIGHT = 0.3
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fused_swarm(positions, velocities, best_positions, best_scores,
+                     priorities, salience_score, n_iterations):
+        """Run the swarm in place, fusing dynamics, clamping and scoring per particle
+        
+        Returns the index of the global best particle.
+        """
+        n_particles = positions.shape[0]
+        # Numba freezes globals at compile time, so the 768-dim inner loops get a
+        # literal trip count that LLVM can fully unroll and vectorize
+        dimensions = EMBEDDING_DIMENSIONS
+        assert positions.shape[1] == dimensions
+        salience = SALIENCE_WEIGHT * salience_score * 0.01
+        scores = np.empty(n_particles)
+        for p in prange(n_particles):
+            cosmos = 0.0
+            total = 0.0
+            for d in range(dimensions):
+                cosmos += positions[p, d] * priorities[d]
+                total += positions[p, d]
+            scores[p] = cosmos / (1.0 + abs(total - salience_score))
+        
+        global_best_index = 0
+        previous_best = -np.inf
+        stalled = 0
+        for iteration in range(n_iterations):
+            for p in range(n_particles):
+                if scores[p] > best_scores[p]:
+                    best_scores[p] = scores[p]
+                    best_positions[p, :] = positions[p, :]
+                    if scores[p] > best_scores[global_best_index]:
+                        global_best_index = p
+            current_best = best_scores[global_best_index]
+            stalled = stalled + 1 if iteration > 0 and current_best - previous_best < CONVERGENCE_TOLERANCE else 0
+            if stalled >= CONVERGENCE_PATIENCE or iteration == n_iterations - 1:
+                break  # Converged, or the final move would never be scored
+            previous_best = current_best
+            
+            global_best = best_positions[global_best_index]
+            for p in prange(n_particles):
+                cosmos = 0.0
+                total = 0.0
+                for d in range(dimensions):
+                    v = (INERTIA_WEIGHT * velocities[p, d]
+                         + COGNITIVE_WEIGHT * (best_positions[p, d] - positions[p, d])
+                         + SOCIAL_WEIGHT * (global_best[d] - positions[p, d])
+                         + salience)
+                    velocities[p, d] = v
+                    x = min(max(positions[p, d] + v, -1.0), 1.0)  # Lowers to SIMD max/min
+                    positions[p, d] = x
+                    cosmos += x * priorities[d]
+                    total += x
+                scores[p] = cosmos / (1.0 + abs(total - salience_score))
+        return global_best_index
+else:
+    try:
+        from pso_kernel import fused_swarm as _compiled_swarm  # Cython build of the same kernel
+    except ImportError:
+        _fused_swarm = None
+    else:
+        def _fused_swarm(positions, velocities, best_positions, best_scores,
+                         priorities, salience_score, n_iterations):
+            return _compiled_swarm(positions, velocities, best_positions, best_scores,
+                                   priorities, salience_score, n_iterations, INERTIA_WEIGHT,
+                                   COGNITIVE_WEIGHT, SOCIAL_WEIGHT, SALIENCE_WEIGHT,
+                                   CONVERGENCE_TOLERANCE, CONVERGENCE_PATIENCE)
+
+
+@dataclass(slots=True)
 class CognitiveCity:
     """A GitHub organization functioning as a cognitive city"""
     name: str
@@ -18,17 +119,31 @@ class CognitiveCity:
     neural_transport_channels: Dict[str, str]
     memory_patterns: Dict[str, Any]
     activation_landscape: Dict[str, float]
+    channel_keys: Dict[str, str] = field(default_factory=dict)  # target namespace -> transport channel key
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextualMemoryPattern:
     """Patterns of action and execution traces for progressive encoding"""
     pattern_id: str
     priority_profile: Dict[str, float]
     execution_trace: List[Dict[str, Any]]
-    embedding_vector: Optional[List[float]]
+    embedding_vector: Optional[np.ndarray]  # float32; values lie in [-1, 1]
     salience_score: float
     organization_context: str
+    # Dense 'dim_<i>' weights built from priority_profile; reset to None after mutating the profile
+    _priority_vec: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    
+    def priority_vector(self) -> np.ndarray:
+        """Dense weights for the priority profile's 'dim_<i>' entries, built on first use"""
+        if self._priority_vec is None:
+            priorities = np.zeros(EMBEDDING_DIMENSIONS)
+            for key, weight in self.priority_profile.items():
+                if key.startswith('dim_') and key[4:].isdigit() and int(key[4:]) < EMBEDDING_DIMENSIONS:
+                    priorities[int(key[4:])] = weight
+            priorities.flags.writeable = False
+            self._priority_vec = priorities
+        return self._priority_vec
 
 
 class OperationalizedRAGFabric:
@@ -38,6 +153,14 @@ class OperationalizedRAGFabric:
         self.cognitive_cities: Dict[str, CognitiveCity] = {}
         self.memory_patterns: Dict[str, ContextualMemoryPattern] = {}
         self.neural_transport = NeuralTransportNetwork()
+        # Swarm results keyed by (priority weights, salience); the swarm is seeded
+        self._embedding_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        # Scratch buffers reused by every swarm run
+        self._swarm_lock = threading.Lock()
+        self._swarm_positions = np.empty((SWARM_SIZE, EMBEDDING_DIMENSIONS))
+        self._swarm_velocities = np.empty_like(self._swarm_positions)
+        self._swarm_best_positions = np.empty_like(self._swarm_positions)
+        self._swarm_best_scores = np.empty(SWARM_SIZE)
         
     async def register_cognitive_city(self, city: CognitiveCity):
         """Register a new cognitive city (GitHub org) in the network"""
@@ -46,95 +169,125 @@ class OperationalizedRAGFabric:
         
     async def encode_memory_pattern(self, pattern: ContextualMemoryPattern):
         """Progressively encode contextual memories as action patterns"""
+        priorities = pattern.priority_vector()
+        
         # Apply particle swarm optimization for memory embedding
-        optimized_embedding = await self.particle_swarm_optimize(pattern)
-        pattern.embedding_vector = optimized_embedding
+        cache_key = (priorities.tobytes(), pattern.salience_score)
+        cached = self._embedding_cache.get(cache_key)
+        if cached is not None:
+            self._embedding_cache.move_to_end(cache_key)
+            pattern.embedding_vector = cached
+        else:
+            # Stored as read-only float32 so patterns can share the cached array
+            optimized_embedding = self.particle_swarm_optimize(pattern, priorities)
+            optimized_embedding.flags.writeable = False
+            pattern.embedding_vector = optimized_embedding
+            self._embedding_cache[cache_key] = optimized_embedding
+            if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
         
         # Update activation landscape based on priority profile
         await self.update_activation_landscape(pattern)
         
         self.memory_patterns[pattern.pattern_id] = pattern
         
-    async def particle_swarm_optimize(self, pattern: ContextualMemoryPattern) -> List[float]:
+    def particle_swarm_optimize(self, pattern: ContextualMemoryPattern,
+                                priorities: np.ndarray) -> np.ndarray:
         """LLM-as-particle-swarm-accelerator for memory optimization"""
-        # Simulate particle swarm dynamics for optimal memory encoding
-        particles = []
-        for i in range(10):  # Small swarm for demonstration
-            particle = {
-                'position': [0.5] * 768,  # Embedding dimension
-                'velocity': [0.1] * 768,
-                'best_position': None,
-                'best_score': float('-inf')
-            }
-            particles.append(particle)
+        # Simulate particle swarm dynamics for optimal memory encoding.
+        # Swarm state is kept as (particles, embedding dimension) arrays so each
+        # iteration updates the whole swarm in a few vectorized passes.
+        with self._swarm_lock:  # The scratch buffers are shared, so one swarm at a time
+            # Reuse the fabric's scratch buffers, refilled in place
+            positions, velocities = self._swarm_positions, self._swarm_velocities
+            best_positions, best_scores = self._swarm_best_positions, self._swarm_best_scores
+            rng = np.random.default_rng(SWARM_SEED)
+            rng.random(out=positions)
+            positions *= 2.0
+            positions -= 1.0  # Uniform in [-1, 1)
+            rng.standard_normal(out=velocities)
+            velocities *= 0.1
+            best_positions[...] = positions
+            best_scores.fill(-np.inf)
             
-        # Swarm optimization iterations
-        for iteration in range(50):
-            for particle in particles:
-                # Evaluate particle position using priority profile
-                score = await self.evaluate_memory_encoding(particle['position'], pattern)
+            # Swarm optimization iterations
+            if _fused_swarm is not None:
+                global_best_index = _fused_swarm(positions, velocities, best_positions, best_scores,
+                                                 priorities, pattern.salience_score, SWARM_ITERATIONS)
+            else:
+                global_best_index = 0
+                previous_best = -np.inf
+                stalled = 0
+                for iteration in range(SWARM_ITERATIONS):
+                    # Evaluate all particle positions using priority profile
+                    scores = self.evaluate_memory_encoding(positions, priorities, pattern.salience_score)
                 
-                if score > particle['best_score']:
-                    particle['best_score'] = score
-                    particle['best_position'] = particle['position'].copy()
+                    # The global best can only move to this iteration's best particle
+                    candidate = int(scores.argmax())
+                    improved = scores > best_scores
+                    best_scores[improved] = scores[improved]
+                    best_positions[improved] = positions[improved]
+                    if best_scores[candidate] > best_scores[global_best_index]:
+                        global_best_index = candidate
+                    
+                    # Stop once the swarm has converged
+                    current_best = best_scores[global_best_index]
+                    stalled = stalled + 1 if iteration > 0 and current_best - previous_best < CONVERGENCE_TOLERANCE else 0
+                    if stalled >= CONVERGENCE_PATIENCE:
+                        break
+                    previous_best = current_best
                     
-                # Update velocity and position based on swarm dynamics
-                await self.update_particle_dynamics(particle, particles, pattern)
+                    # Update velocity and position based on swarm dynamics
+                    global_best = best_positions[global_best_index]
+                    self.update_particle_dynamics(positions, velocities, best_positions, global_best, pattern)
                 
-        # Return best encoding found by swarm
-        best_particle = max(particles, key=lambda p: p['best_score'])
-        return best_particle['best_position']
+            # Return best encoding found by swarm
+            return best_positions[global_best_index].astype(np.float32)
         
-    async def evaluate_memory_encoding(self, embedding: List[float], pattern: ContextualMemoryPattern) -> float:
-        """Evaluate quality of memory encoding using priority profile"""
+    def evaluate_memory_encoding(self, embeddings: np.ndarray, priorities: np.ndarray,
+                                 salience_score: float) -> np.ndarray:
+        """Evaluate quality of memory encodings (one per row) using priority weights"""
         # Cosmo (ordering principle) evaluation
-        cosmos_score = sum(embedding[i] * pattern.priority_profile.get(f'dim_{i}', 0.0) 
-                          for i in range(len(embedding)))
+        cosmos_score = embeddings @ priorities
         
         # Ordo ab chao (order from chaos) coherence
-        coherence_score = 1.0 / (1.0 + abs(sum(embedding) - pattern.salience_score))
+        coherence_score = 1.0 / (1.0 + np.abs(embeddings.sum(axis=1) - salience_score))
         
         return cosmos_score * coherence_score
         
-    async def update_particle_dynamics(self, particle: Dict, swarm: List[Dict], pattern: ContextualMemoryPattern):
-        """Update particle velocity and position using cognitive ecology principles"""
-        # Global best position from swarm
-        global_best = max(swarm, key=lambda p: p['best_score'])['best_position']
-        
-        # Cognitive inertia + personal best + global best + org-level salience
-        inertia_weight = 0.7
-        cognitive_weight = 1.4
-        social_weight = 1.4
-        salience_weight = 0.3
-        
-        for i in range(len(particle['velocity'])):
-            # Standard PSO update with org-level salience monitoring
-            inertia = inertia_weight * particle['velocity'][i]
-            cognitive = cognitive_weight * (particle['best_position'][i] - particle['position'][i])
-            social = social_weight * (global_best[i] - particle['position'][i])
-            salience = salience_weight * pattern.salience_score * 0.01  # Scale salience influence
-            
-            particle['velocity'][i] = inertia + cognitive + social + salience
-            particle['position'][i] += particle['velocity'][i]
-            
-            # Clamp to valid embedding space [-1, 1]
-            particle['position'][i] = max(-1.0, min(1.0, particle['position'][i]))
+    def update_particle_dynamics(self, positions: np.ndarray, velocities: np.ndarray,
+                                 best_positions: np.ndarray, global_best: np.ndarray,
+                                 pattern: ContextualMemoryPattern):
+        """Update swarm velocities and positions in place using cognitive ecology principles"""
+        # Standard PSO update with org-level salience monitoring
+        salience = SALIENCE_WEIGHT * pattern.salience_score * 0.01  # Scale salience influence
+        velocities *= INERTIA_WEIGHT
+        velocities += COGNITIVE_WEIGHT * (best_positions - positions)
+        velocities += SOCIAL_WEIGHT * (global_best - positions)
+        velocities += salience
+        positions += velocities
+        
+        # Clamp to valid embedding space [-1, 1]
+        np.clip(positions, -1.0, 1.0, out=positions)
             
     async def update_activation_landscape(self, pattern: ContextualMemoryPattern):
         """Update dynamical system activation landscape for org-level salience"""
-        org_context = pattern.organization_context
-        if org_context in self.cognitive_cities:
-            city = self.cognitive_cities[org_context]
+        city = self.cognitive_cities.get(pattern.organization_context)
+        if city is not None:
+            # Update activation based on priority profile and execution traces.
+            # Fractal activation: pattern activates related specializations
+            profile = pattern.priority_profile
+            salience = pattern.salience_score
+            updates = [(specialty, profile[specialty] * salience)
+                       for specialty in city.specializations if specialty in profile]
             
-            # Update activation based on priority profile and execution traces
-            for specialty in city.specializations:
-                if specialty in pattern.priority_profile:
-                    # Fractal activation: pattern activates related specializations
-                    activation_boost = pattern.priority_profile[specialty] * pattern.salience_score
-                    city.activation_landscape[specialty] = city.activation_landscape.get(specialty, 0.0) + activation_boost
+            landscape = city.activation_landscape
+            for specialty, activation_boost in updates:
+                landscape[specialty] = landscape.get(specialty, 0.0) + activation_boost
                     
-                    # Neural transport to connected cities
-                    await self.neural_transport.propagate_activation(city, specialty, activation_boost)
+            # Neural transport to connected cities, one batch per channel
+            if updates:
+                await self.neural_transport.propagate_activations(city, updates)
 
 
 class NeuralTransportNetwork:
@@ -148,25 +301,35 @@ class NeuralTransportNetwork:
         """Establish neural transport channels for a cognitive city"""
         for channel_name, target_namespace in city.neural_transport_channels.items():
             channel_key = f"{city.namespace}::{target_namespace}"
+            city.channel_keys[target_namespace] = channel_key
             self.transport_channels[channel_key] = {
                 'bandwidth': 1.0,
                 'latency': 0.1,
                 'quality': 0.95
             }
             
-    async def propagate_activation(self, source_city: CognitiveCity, specialty: str, activation: float):
-        """Propagate activation through neural transport network"""
-        for target_namespace in source_city.neural_transport_channels.values():
-            channel_key = f"{source_city.namespace}::{target_namespace}"
-            if channel_key in self.transport_channels:
+    async def propagate_activations(self, source_city: CognitiveCity, updates: List[Tuple[str, float]]):
+        """Propagate a batch of (specialty, activation) updates through the neural transport network"""
+        transport_slots = asyncio.Semaphore(MAX_CONCURRENT_TRANSPORTS)
+        trace = logger.isEnabledFor(logging.DEBUG)
+        
+        async def transport(target_namespace: str, channel: Dict[str, float]):
+            async with transport_slots:
                 # Transport activation with quality preservation
-                channel = self.transport_channels[channel_key]
-                transported_activation = activation * channel['quality'] * channel['bandwidth']
-                
-                # Apply to target city if it exists and has the specialty
-                # (In practice, this would use GitHub API to update target org state)
-                print(f"Transporting {transported_activation:.3f} activation for {specialty} "
-                      f"from {source_city.namespace} to {target_namespace}")
+                for specialty, activation in updates:
+                    transported_activation = activation * channel['quality'] * channel['bandwidth']
+                    
+                    # Apply to target city if it exists and has the specialty
+                    # (In practice, this would use GitHub API to update target org state)
+                    if trace:
+                        logger.debug("Transporting %.3f activation for %s from %s to %s",
+                                     transported_activation, specialty, source_city.namespace, target_namespace)
+        
+        # Channels are independent, so the whole batch goes out to all of them concurrently
+        channels = self.transport_channels
+        await asyncio.gather(*(transport(target_namespace, channels[channel_key])
+                               for target_namespace, channel_key in source_city.channel_keys.items()
+                               if channel_key in channels))
 
 
 # Example usage demonstrating the cognitive ecology in action
@@ -200,9 +363,9 @@ async def demonstrate_cognitive_ecology():
         activation_landscape={"urban_planning": 0.7, "distributed_systems": 0.8}
     )
     
-    # Register cities in the cognitive ecology
-    await rag_fabric.register_cognitive_city(cogpilot_city)
-    await rag_fabric.register_cognitive_city(cogcities_city)
+    # Register cities in the cognitive ecology; channel setup is independent per city
+    await asyncio.gather(*(rag_fabric.register_cognitive_city(city)
+                           for city in (cogpilot_city, cogcities_city)))
     
     # Create a contextual memory pattern from this conversation
     conversation_pattern = ContextualMemoryPattern(
@@ -241,5 +404,12 @@ async def demonstrate_cognitive_ecology():
 
 
 if __name__ == "__main__":
-    # Run the cognitive ecology demonstration
-    asyncio.run(demonstrate_cognitive_ecology())
+    # Show neural transport activity in the demo output
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    
+    # Run the cognitive ecology demonstration, on libuv's event loop when available
+    if uvloop is not None:
+        uvloop.run(demonstrate_cognitive_ecology())
+    else:
+        asyncio.run(demonstrate_cognitive_ecology())
@@ -6,15 +6,84 @@ This module demonstrates the operational reality of cognitive architecture princ
 within the cogpilot organization ecosystem.
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
 import json
-from typing import Dict, Any, List, Optional
+import sys
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, ClassVar
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import numpy as np
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy and Numba are only needed once a swarm actually runs, so they are
+# imported on first use instead of at module import (together they add several
+# hundred milliseconds to a cold start).
+
+SWARM_ITERATIONS = 30
+MAX_VELOCITY = 0.2  # Per-dimension speed limit, 10% of the [-1, 1] embedding range
+
+
+@functools.lru_cache(maxsize=None)
+def _swarm_rng():
+    """Shared generator for swarm initialisation and acceleration coefficients"""
+    import numpy as np
+    return np.random.default_rng()
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _load_pso_kernel():
+    """Import Numba and return the compiled swarm kernel, or None without Numba"""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    # cache=True writes the compiled kernel to __pycache__ (.nbi/.nbc files) on the
+    # first run, so later runs of the demo skip LLVM compilation. boundscheck=False
+    # keeps bounds checks off even when NUMBA_BOUNDSCHECK is set for debugging.
+    @njit(parallel=True, cache=True, fastmath=True, boundscheck=False)
+    def _pso_kernel(positions, velocities, best_positions, best_scores, weights, salience, maturity,
+                    phi1, phi2):
+        """Compiled swarm loop over a batch of swarms (one per pattern), updating them in place
+        
+        Runs one iteration per (phi1, phi2) pair. Particles are scored and moved in
+        parallel; picking each swarm's global best stays sequential between the two.
+        """
+        n_swarms, n_particles, dimensions = positions.shape
+        n_iterations = phi1.shape[0]
+        for s in range(n_swarms):
+            for iteration in range(n_iterations):
+                for p in prange(n_particles):
+                    cosmos = 0.0
+                    total = 0.0
+                    for d in range(dimensions):
+                        cosmos += positions[s, p, d] * weights[s, d]
+                        total += positions[s, p, d]
+                    score = cosmos / (1.0 + abs(total - salience[s])) * (1.0 + maturity)
+                    if score > best_scores[s, p]:
+                        best_scores[s, p] = score
+                        best_positions[s, p, :] = positions[s, p, :]
+                if iteration == n_iterations - 1:
+                    break  # The final move would never be scored
+                
+                global_best = best_positions[s, best_scores[s].argmax()]
+                for p in prange(n_particles):
+                    for d in range(dimensions):
+                        v = (velocities[s, p, d]
+                             + phi1[iteration] * (best_positions[s, p, d] - positions[s, p, d])
+                             + phi2[iteration] * (global_best[d] - positions[s, p, d]))
+                        v = min(max(v, -MAX_VELOCITY), MAX_VELOCITY)
+                        velocities[s, p, d] = v
+                        positions[s, p, d] = min(max(positions[s, p, d] + v, -1.0), 1.0)
+    return _pso_kernel
+
+
+@dataclass(slots=True)
 class CognitiveCity:
     """A GitHub organization functioning as a cognitive city"""
     name: str
@@ -27,13 +96,13 @@ class CognitiveCity:
     cognitive_maturity: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextualMemoryPattern:
     """Patterns of action and execution traces for progressive encoding"""
     pattern_id: str
     priority_profile: Dict[str, float]
     execution_trace: List[Dict[str, Any]]
-    embedding_vector: Optional[List[float]]
+    embedding_vector: Optional[np.ndarray]  # float32
     salience_score: float
     organization_context: str
     created_at: datetime
@@ -46,11 +115,35 @@ class CogpilotCognitiveArchitecture:
     Demonstrates living AI development ecosystem in action
     """
     
+    # Namespace of the primary cognitive city
+    COGPILOT_NS: ClassVar[str] = "github.com/organizations/cogpilot"
+    
+    # Static parts of the forge report, built once per process
+    _REPORT_CITY_FIELDS = (
+        "name", "namespace", "repository_count", "cognitive_maturity",
+        "specializations", "activation_landscape"
+    )
+    _NEXT_EVOLUTION_STEPS = (
+        "Monitor emergent cognitive behaviors",
+        "Expand knowledge base with Phase 2 repositories",
+        "Develop advanced neural transport protocols",
+        "Implement meta-cognitive monitoring systems",
+        "Create evolutionary adaptation mechanisms"
+    )
+    _EXPECTED_COGNITIVE_EVOLUTION = MappingProxyType({
+        "week_1": "Basic architectural pattern recognition",
+        "week_2": "Multi-system coordination proposals",
+        "week_3": "Context-aware memory implementations",
+        "week_4": "Meta-cognitive protocol design capabilities"
+    })
+    
     def __init__(self):
         self.cognitive_cities: Dict[str, CognitiveCity] = {}
         self.memory_patterns: Dict[str, ContextualMemoryPattern] = {}
         self.neural_transport = NeuralTransportNetwork()
         self.evolution_generation = 1
+        # Patterns awaiting embedding, optimized together at the end of the forge
+        self._pending_patterns: List[ContextualMemoryPattern] = []
         
         # Initialize cogpilot as primary cognitive city
         self._initialize_cogpilot_city()
@@ -59,7 +152,7 @@ class CogpilotCognitiveArchitecture:
         """Initialize the primary cogpilot cognitive city"""
         cogpilot_city = CognitiveCity(
             name="Cogpilot Primary",
-            namespace="github.com/organizations/cogpilot",
+            namespace=self.COGPILOT_NS,
             specializations=[
                 "cognitive_architecture",
                 "particle_swarm_optimization", 
@@ -88,23 +181,25 @@ class CogpilotCognitiveArchitecture:
         )
         
         self.cognitive_cities[cogpilot_city.namespace] = cogpilot_city
+        self._primary_city = cogpilot_city
         
     async def forge_cognitive_architecture(self):
         """
         Forge the initial cognitive architecture by implementing
         the foundational patterns and neural transport channels
         """
-        print("🚀 Forging Cogpilot Cognitive Architecture...")
-        print("=" * 50)
+        sys.stdout.write("🚀 Forging Cogpilot Cognitive Architecture...\n" + "=" * 50 + "\n")
         
         # Phase 1: Establish foundational repositories
         await self._create_foundational_repositories()
         
-        # Phase 2: Implement custom instructions
-        await self._deploy_custom_instructions()
-        
-        # Phase 3: Configure knowledge base
-        await self._configure_knowledge_base()
+        # Phase 2: Implement custom instructions, and
+        # Phase 3: Configure knowledge base.
+        # These touch disjoint memory patterns, so they run concurrently.
+        await asyncio.gather(
+            self._deploy_custom_instructions(),
+            self._configure_knowledge_base()
+        )
         
         # Phase 4: Establish neural transport channels
         await self._establish_neural_transport()
@@ -112,12 +207,15 @@ class CogpilotCognitiveArchitecture:
         # Phase 5: Begin self-referential enhancement
         await self._initiate_self_referential_loop()
         
+        # Embed the new memory patterns in a single batched swarm run
+        self._optimize_pending_patterns()
+        
         print("\n✨ Cognitive Architecture Forge Complete!")
         return self._generate_forge_report()
         
     async def _create_foundational_repositories(self):
         """Create the foundational repository structure"""
-        print("\n🏗️ Creating Foundational Repository Structure...")
+        lines = ["\n🏗️ Creating Foundational Repository Structure..."]
         
         repositories = [
             {
@@ -147,10 +245,10 @@ class CogpilotCognitiveArchitecture:
             }
         ]
         
-        cogpilot_city = self.cognitive_cities["github.com/organizations/cogpilot"]
+        cogpilot_city = self._primary_city
         
         for repo in repositories:
-            print(f"  ✓ Creating repository: {repo['name']}")
+            lines.append(f"  ✓ Creating repository: {repo['name']}")
             # In production, this would use GitHub API to create actual repositories
             # For demo, we simulate the creation and update cognitive city state
             
@@ -160,10 +258,11 @@ class CogpilotCognitiveArchitecture:
                     
         cogpilot_city.repository_count = len(repositories)
         cogpilot_city.cognitive_maturity += 0.2
+        sys.stdout.write("\n".join(lines) + "\n")
         
     async def _deploy_custom_instructions(self):
         """Deploy custom instructions to enhance cognitive capabilities"""
-        print("\n🧠 Deploying Custom Instructions...")
+        now = datetime.now()
         
         instruction_pattern = ContextualMemoryPattern(
             pattern_id="cogpilot_custom_instructions_v1",
@@ -178,27 +277,27 @@ class CogpilotCognitiveArchitecture:
                 {
                     "action": "deploy_custom_instructions",
                     "context": "cogpilot organization settings",
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "success": True
                 }
             ],
             embedding_vector=None,
             salience_score=0.95,
-            organization_context="github.com/organizations/cogpilot",
-            created_at=datetime.now(),
+            organization_context=self.COGPILOT_NS,
+            created_at=now,
             evolution_generation=self.evolution_generation
         )
         
-        # Apply particle swarm optimization to the instruction pattern
-        optimized_embedding = await self._particle_swarm_optimize(instruction_pattern)
-        instruction_pattern.embedding_vector = optimized_embedding
+        # Queue the instruction pattern for particle swarm optimization
+        self._pending_patterns.append(instruction_pattern)
         
         self.memory_patterns[instruction_pattern.pattern_id] = instruction_pattern
-        print("  ✓ Custom instructions deployed and optimized")
+        sys.stdout.write("\n🧠 Deploying Custom Instructions...\n"
+                         "  ✓ Custom instructions deployed and queued for optimization\n")
         
     async def _configure_knowledge_base(self):
         """Configure the self-referential knowledge base"""
-        print("\n📚 Configuring Self-Referential Knowledge Base...")
+        now = datetime.now()
         
         # Phase 1: Foundational repositories
         foundational_repos = [
@@ -232,27 +331,28 @@ class CogpilotCognitiveArchitecture:
                 {
                     "action": "configure_knowledge_base",
                     "repositories_added": len(all_repos),
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "phase": "foundational_plus_self_referential"
                 }
             ],
             embedding_vector=None,
             salience_score=0.92,
-            organization_context="github.com/organizations/cogpilot",
-            created_at=datetime.now(),
+            organization_context=self.COGPILOT_NS,
+            created_at=now,
             evolution_generation=self.evolution_generation
         )
         
         self.memory_patterns[knowledge_pattern.pattern_id] = knowledge_pattern
         
-        for repo in all_repos:
-            print(f"  ✓ Added to knowledge base: {repo}")
+        lines = ["\n📚 Configuring Self-Referential Knowledge Base..."]
+        lines.extend(f"  ✓ Added to knowledge base: {repo}" for repo in all_repos)
+        sys.stdout.write("\n".join(lines) + "\n")
             
     async def _establish_neural_transport(self):
         """Establish neural transport channels to connected cognitive cities"""
         print("\n🌊 Establishing Neural Transport Channels...")
         
-        cogpilot_city = self.cognitive_cities["github.com/organizations/cogpilot"]
+        cogpilot_city = self._primary_city
         
         # Establish channel to cogcities
         await self.neural_transport.establish_channel(
@@ -272,12 +372,12 @@ class CogpilotCognitiveArchitecture:
         cogpilot_city.activation_landscape["neural_transport_protocols"] += 0.15
         cogpilot_city.cognitive_maturity += 0.1
         
-        print("  ✓ Neural transport channel to cogcities established")
-        print("  ✓ Neural transport channel to cosmo enterprise established")
+        sys.stdout.write("  ✓ Neural transport channel to cogcities established\n"
+                         "  ✓ Neural transport channel to cosmo enterprise established\n")
         
     async def _initiate_self_referential_loop(self):
         """Begin the self-referential cognitive enhancement loop"""
-        print("\n🔄 Initiating Self-Referential Enhancement Loop...")
+        now = datetime.now()
         
         loop_pattern = ContextualMemoryPattern(
             pattern_id="self_referential_loop_initialization",
@@ -290,7 +390,7 @@ class CogpilotCognitiveArchitecture:
             execution_trace=[
                 {
                     "action": "initiate_self_referential_loop",
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "cognitive_maturity_before": 0.6,
                     "expected_emergent_behaviors": [
                         "architectural_thinking_in_suggestions",
@@ -302,95 +402,128 @@ class CogpilotCognitiveArchitecture:
             ],
             embedding_vector=None,
             salience_score=0.88,
-            organization_context="github.com/organizations/cogpilot",
-            created_at=datetime.now(),
+            organization_context=self.COGPILOT_NS,
+            created_at=now,
             evolution_generation=self.evolution_generation
         )
         
-        # Optimize the self-referential loop pattern
-        optimized_embedding = await self._particle_swarm_optimize(loop_pattern)
-        loop_pattern.embedding_vector = optimized_embedding
+        # Queue the self-referential loop pattern for optimization
+        self._pending_patterns.append(loop_pattern)
         
         self.memory_patterns[loop_pattern.pattern_id] = loop_pattern
         
         # Update cognitive maturity to reflect self-referential capability
-        cogpilot_city = self.cognitive_cities["github.com/organizations/cogpilot"]
+        cogpilot_city = self._primary_city
         cogpilot_city.cognitive_maturity = 0.75  # Significant boost from self-referential loop
         
-        print("  ✓ Self-referential enhancement loop active")
-        print("  ✓ Cognitive maturity elevated to 0.75")
-        
-    async def _particle_swarm_optimize(self, pattern: ContextualMemoryPattern) -> List[float]:
-        """Optimize memory pattern using particle swarm intelligence"""
-        # Simplified particle swarm for demonstration
-        particles = []
-        for i in range(8):  # Small swarm for efficiency
-            particle = {
-                'position': np.random.uniform(-1, 1, 768).tolist(),
-                'velocity': np.random.uniform(-0.1, 0.1, 768).tolist(),
-                'best_position': None,
-                'best_score': float('-inf')
-            }
-            particles.append(particle)
+        sys.stdout.write("\n🔄 Initiating Self-Referential Enhancement Loop...\n"
+                         "  ✓ Self-referential enhancement loop active\n"
+                         "  ✓ Cognitive maturity elevated to 0.75\n")
+        
+    def _optimize_pending_patterns(self):
+        """Encode every memory pattern queued by the forge phases in one batched swarm run"""
+        if not self._pending_patterns:
+            return
+        patterns, self._pending_patterns = self._pending_patterns, []
+        for pattern, embedding in zip(patterns, self._particle_swarm_optimize_batch(patterns)):
+            pattern.embedding_vector = embedding
+        print(f"\n🐝 Particle swarm optimized {len(patterns)} memory patterns")
+        
+    def _particle_swarm_optimize_batch(self, patterns: List[ContextualMemoryPattern]) -> List[np.ndarray]:
+        """Optimize several memory patterns at once, with one independent swarm per pattern"""
+        import numpy as np
+        
+        # Simplified particle swarm for demonstration. Swarm state is kept as
+        # (patterns, particles, embedding dimension) float32 arrays and scored
+        # all swarms at a time.
+        rng = _swarm_rng()
+        n_swarms, n_particles, dimensions = len(patterns), 8, 768  # Small swarms for efficiency
+        positions = rng.random((n_swarms, n_particles, dimensions), dtype=np.float32) * 2.0 - 1.0
+        velocities = rng.random((n_swarms, n_particles, dimensions), dtype=np.float32) * 0.2 - 0.1
+        best_positions = positions.copy()
+        best_scores = np.full((n_swarms, n_particles), -np.inf)
+        weights = np.stack([self._priority_weights(pattern, dimensions) for pattern in patterns])
+        salience = np.array([pattern.salience_score for pattern in patterns], dtype=np.float32)
+        # Random acceleration coefficients in [0, 2], drawn per iteration (canonical PSO)
+        phi1 = rng.random(SWARM_ITERATIONS, dtype=np.float32) * 2.0
+        phi2 = rng.random(SWARM_ITERATIONS, dtype=np.float32) * 2.0
+        swarms = np.arange(n_swarms)
+        # Cognitive maturity bonus; constant for the whole run
+        maturity = self._primary_city.cognitive_maturity
             
         # Optimize over multiple iterations
-        for iteration in range(30):
-            for particle in particles:
-                # Evaluate particle using priority profile and salience
-                score = await self._evaluate_memory_encoding(particle['position'], pattern)
+        pso_kernel = _load_pso_kernel()
+        if pso_kernel is not None:
+            pso_kernel(positions, velocities, best_positions, best_scores, weights,
+                       salience, maturity, phi1, phi2)
+        else:
+            for iteration in range(SWARM_ITERATIONS):
+                # Evaluate all particles using priority profile and salience
+                scores = self._evaluate_memory_encoding(positions, weights, salience, maturity)
+                
+                improved = scores > best_scores
+                best_scores[improved] = scores[improved]
+                best_positions[improved] = positions[improved]
+                if iteration == SWARM_ITERATIONS - 1:
+                    break  # The final move would never be scored
                 
-                if score > particle['best_score']:
-                    particle['best_score'] = score
-                    particle['best_position'] = particle['position'].copy()
+                # Move each swarm towards its personal and global bests
+                global_best = best_positions[swarms, best_scores.argmax(axis=1)][:, np.newaxis, :]
+                velocities += phi1[iteration] * (best_positions - positions)
+                velocities += phi2[iteration] * (global_best - positions)
+                np.clip(velocities, -MAX_VELOCITY, MAX_VELOCITY, out=velocities)
+                positions += velocities
+                np.clip(positions, -1.0, 1.0, out=positions)
                     
-        # Return best solution
-        best_particle = max(particles, key=lambda p: p['best_score'])
-        return best_particle['best_position']
+        # Return best solution of each swarm
+        return list(best_positions[swarms, best_scores.argmax(axis=1)])
+        
+    @staticmethod
+    def _priority_weights(pattern: ContextualMemoryPattern, dimensions: int) -> np.ndarray:
+        """Per-dimension cosmos weights: 0.1 (or a 'dim_<i>' override) over the first len(priority_profile) dims"""
+        import numpy as np
+        
+        weighted_dims = min(dimensions, len(pattern.priority_profile))
+        weights = np.zeros(dimensions, dtype=np.float32)
+        weights[:weighted_dims] = 0.1
+        for key, weight in pattern.priority_profile.items():
+            if key.startswith('dim_') and key[4:].isdigit() and int(key[4:]) < weighted_dims:
+                weights[int(key[4:])] = weight
+        return weights
+        
+    def _evaluate_memory_encoding(self, embeddings: np.ndarray, weights: np.ndarray,
+                                  salience_score, maturity_bonus: float) -> np.ndarray:
+        """Evaluate memory encoding quality using cognitive architecture principles
+        
+        Scores each row of ``embeddings`` (..., particles, dims) against the matching
+        ``weights`` (..., dims) and salience score(s), boosted by cognitive maturity.
+        """
+        import numpy as np
         
-    async def _evaluate_memory_encoding(self, embedding: List[float], pattern: ContextualMemoryPattern) -> float:
-        """Evaluate memory encoding quality using cognitive architecture principles"""
         # Cosmo (ordering principle) evaluation
-        cosmos_score = sum(embedding[i] * pattern.priority_profile.get(f'dim_{i}', 0.1) 
-                          for i in range(min(len(embedding), len(pattern.priority_profile))))
+        cosmos_score = np.einsum('...pd,...d->...p', embeddings, weights)
         
         # Ordo ab chao coherence score
-        coherence_score = 1.0 / (1.0 + abs(sum(embedding) - pattern.salience_score))
+        salience_score = np.asarray(salience_score, dtype=embeddings.dtype)[..., np.newaxis]
+        coherence_score = 1.0 / (1.0 + np.abs(embeddings.sum(axis=-1) - salience_score))
         
         # Cognitive maturity bonus
-        maturity_bonus = self.cognitive_cities["github.com/organizations/cogpilot"].cognitive_maturity
-        
         return cosmos_score * coherence_score * (1.0 + maturity_bonus)
         
     def _generate_forge_report(self) -> Dict[str, Any]:
         """Generate a comprehensive report of the forge operation"""
-        cogpilot_city = self.cognitive_cities["github.com/organizations/cogpilot"]
+        cogpilot_city = self._primary_city
         
         return {
             "forge_timestamp": datetime.now().isoformat(),
             "cognitive_city_status": {
-                "name": cogpilot_city.name,
-                "namespace": cogpilot_city.namespace,
-                "repository_count": cogpilot_city.repository_count,
-                "cognitive_maturity": cogpilot_city.cognitive_maturity,
-                "specializations": cogpilot_city.specializations,
-                "activation_landscape": cogpilot_city.activation_landscape
+                field_name: getattr(cogpilot_city, field_name) for field_name in self._REPORT_CITY_FIELDS
             },
             "memory_patterns_created": len(self.memory_patterns),
             "neural_transport_channels": len(cogpilot_city.neural_transport_channels),
             "self_referential_loop_status": "ACTIVE",
-            "next_evolution_steps": [
-                "Monitor emergent cognitive behaviors",
-                "Expand knowledge base with Phase 2 repositories", 
-                "Develop advanced neural transport protocols",
-                "Implement meta-cognitive monitoring systems",
-                "Create evolutionary adaptation mechanisms"
-            ],
-            "expected_cognitive_evolution": {
-                "week_1": "Basic architectural pattern recognition",
-                "week_2": "Multi-system coordination proposals",
-                "week_3": "Context-aware memory implementations", 
-                "week_4": "Meta-cognitive protocol design capabilities"
-            }
+            "next_evolution_steps": list(self._NEXT_EVOLUTION_STEPS),
+            "expected_cognitive_evolution": dict(self._EXPECTED_COGNITIVE_EVOLUTION)
         }
 
 
@@ -421,8 +554,7 @@ class NeuralTransportNetwork:
 # Example usage and demonstration
 async def demonstrate_cogpilot_forge():
     """Demonstrate the cogpilot cognitive architecture forge process"""
-    print("🧠 Cogpilot Cognitive Architecture Forge Demonstration")
-    print("=" * 60)
+    sys.stdout.write("🧠 Cogpilot Cognitive Architecture Forge Demonstration\n" + "=" * 60 + "\n")
     
     # Initialize the cognitive architecture
     architecture = CogpilotCognitiveArchitecture()
@@ -431,16 +563,17 @@ async def demonstrate_cogpilot_forge():
     forge_report = await architecture.forge_cognitive_architecture()
     
     # Display the results
-    print("\n📊 FORGE OPERATION REPORT")
-    print("=" * 30)
-    print(json.dumps(forge_report, indent=2, default=str))
-    
-    print("\n🌟 READY FOR COGNITIVE EVOLUTION")
-    print("=" * 35)
-    print("The cogpilot organization is now a living cognitive architecture!")
-    print("Custom instructions are active, knowledge base is configured,")
-    print("and self-referential enhancement loops are operational.")
-    print("\n🚀 Begin development within the cognitive ecology context!")
+    sys.stdout.write("\n".join([
+        "\n📊 FORGE OPERATION REPORT",
+        "=" * 30,
+        json.dumps(forge_report, indent=2, default=str),
+        "\n🌟 READY FOR COGNITIVE EVOLUTION",
+        "=" * 35,
+        "The cogpilot organization is now a living cognitive architecture!",
+        "Custom instructions are active, knowledge base is configured,",
+        "and self-referential enhancement loops are operational.",
+        "\n🚀 Begin development within the cognitive ecology context!",
+    ]) + "\n")
 
 
 if __name__ == "__main__":
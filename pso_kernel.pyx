@@ -0,0 +1,80 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled particle swarm kernel for cognitive_ecology_demo
+
+Same fused loop as the Numba kernel in cognitive_ecology_demo, for
+deployments that don't ship Numba. Build in place with:
+
+    cythonize -i pso_kernel.pyx
+
+The particle loop uses prange; it only runs in parallel when compiled with
+OpenMP (e.g. CFLAGS=-fopenmp LDFLAGS=-fopenmp).
+"""
+
+from cython.parallel import prange
+from cython.view cimport array as cvarray
+
+# Embedding width, matching cognitive_ecology_demo.EMBEDDING_DIMENSIONS. A
+# compile-time loop bound lets the C compiler fully unroll and vectorize.
+cdef enum:
+    EMBEDDING_DIMENSIONS = 768
+
+
+cpdef Py_ssize_t fused_swarm(double[:, ::1] positions, double[:, ::1] velocities,
+                             double[:, ::1] best_positions, double[::1] best_scores,
+                             const double[::1] priorities, double salience_score,
+                             int n_iterations, double inertia_weight, double cognitive_weight,
+                             double social_weight, double salience_weight,
+                             double tolerance, int patience):
+    """Run the swarm in place and return the index of the global best particle"""
+    cdef Py_ssize_t n_particles = positions.shape[0]
+    cdef Py_ssize_t p, d, global_best_index = 0
+    cdef int iteration, stalled = 0
+    cdef double current_best, previous_best = 0.0
+    cdef double salience = salience_weight * salience_score * 0.01
+    cdef double cosmos, total, v, x
+    cdef double[::1] scores = cvarray(shape=(n_particles,), itemsize=sizeof(double), format="d")
+
+    if positions.shape[1] != EMBEDDING_DIMENSIONS:
+        raise ValueError(f"expected {EMBEDDING_DIMENSIONS}-dimensional positions, got {positions.shape[1]}")
+
+    for p in range(n_particles):
+        cosmos = 0.0
+        total = 0.0
+        for d in range(EMBEDDING_DIMENSIONS):
+            cosmos = cosmos + positions[p, d] * priorities[d]
+            total = total + positions[p, d]
+        scores[p] = cosmos / (1.0 + abs(total - salience_score))
+
+    for iteration in range(n_iterations):
+        for p in range(n_particles):
+            if scores[p] > best_scores[p]:
+                best_scores[p] = scores[p]
+                best_positions[p, :] = positions[p, :]
+                if scores[p] > best_scores[global_best_index]:
+                    global_best_index = p
+        current_best = best_scores[global_best_index]
+        if iteration > 0 and current_best - previous_best < tolerance:
+            stalled += 1
+        else:
+            stalled = 0
+        if stalled >= patience or iteration == n_iterations - 1:
+            break  # Converged, or the final move would never be scored
+        previous_best = current_best
+
+        for p in prange(n_particles, nogil=True):
+            cosmos = 0.0
+            total = 0.0
+            for d in range(EMBEDDING_DIMENSIONS):
+                v = (inertia_weight * velocities[p, d]
+                     + cognitive_weight * (best_positions[p, d] - positions[p, d])
+                     + social_weight * (best_positions[global_best_index, d] - positions[p, d])
+                     + salience)
+                velocities[p, d] = v
+                x = min(max(positions[p, d] + v, -1.0), 1.0)
+                positions[p, d] = x
+                cosmos = cosmos + x * priorities[d]
+                total = total + x
+            scores[p] = cosmos / (1.0 + abs(total - salience_score))
+    return global_best_index
+
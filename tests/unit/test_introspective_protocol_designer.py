@@ -0,0 +1,181 @@
+"""
+Unit tests for the introspective protocol designer.
+Tests request coalescing and the design-result cache.
+"""
+
+import unittest
+import asyncio
+from unittest.mock import patch
+import sys
+import os
+
+# Add the cognitive ecology directory (not an importable package name) to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../cognitive-ecology'))
+
+import introspective_protocol_designer
+from introspective_protocol_designer import IntrospectiveProtocolDesigner
+
+
+class ControlledPipeline:
+    """Stand-in design pipeline that blocks until released and counts its runs"""
+
+    def __init__(self, error=None):
+        self.runs = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.error = error
+
+    async def __call__(self, design_request):
+        self.runs += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {"design": design_request["name"], "run": self.runs}
+
+
+class TestDesignRequestCoalescing(unittest.TestCase):
+    """Test that concurrent identical design requests share one pipeline run"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.designer = IntrospectiveProtocolDesigner()
+        self.request = {"name": "TestProtocol", "purpose": "testing"}
+
+    def run_with_pipeline(self, scenario, error=None):
+        """Run an async scenario against a controlled pipeline"""
+        async def run_test():
+            pipeline = ControlledPipeline(error)
+            with patch.object(self.designer, "_run_design_pipeline", pipeline):
+                await scenario(pipeline)
+
+        asyncio.run(run_test())
+
+    def test_concurrent_requests_are_coalesced(self):
+        """Test that identical concurrent requests run the pipeline once"""
+        async def scenario(pipeline):
+            # Same request with a different key order
+            reordered = {"purpose": "testing", "name": "TestProtocol"}
+            leader = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await pipeline.started.wait()
+            waiter = asyncio.create_task(self.designer.design_protocol_using_introspection(reordered))
+            await asyncio.sleep(0)
+            pipeline.release.set()
+
+            results = await asyncio.gather(leader, waiter)
+            self.assertEqual(pipeline.runs, 1)
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(self.designer._inflight, {})
+
+            # Completed designs are served from the cache
+            cached = await self.designer.design_protocol_using_introspection(self.request)
+            self.assertEqual(cached, results[0])
+            self.assertEqual(pipeline.runs, 1)
+
+        self.run_with_pipeline(scenario)
+
+    def test_cancelled_waiter_does_not_affect_shared_run(self):
+        """Test that cancelling a waiter leaves the leader and other waiters running"""
+        async def scenario(pipeline):
+            leader = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await pipeline.started.wait()
+            cancelled = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            waiter = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await asyncio.sleep(0)
+
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            pipeline.release.set()
+
+            result = await leader
+            self.assertEqual(await waiter, result)
+            with self.assertRaises(asyncio.CancelledError):
+                await cancelled
+            self.assertEqual(pipeline.runs, 1)
+            self.assertIn(self.designer._design_request_key(self.request),
+                          self.designer._design_result_cache)
+
+        self.run_with_pipeline(scenario)
+
+    def test_callers_get_independent_results(self):
+        """Test that changing one caller's design does not affect the others"""
+        async def scenario(pipeline):
+            leader = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await pipeline.started.wait()
+            waiter = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await asyncio.sleep(0)
+            pipeline.release.set()
+
+            leader_result, waiter_result = await asyncio.gather(leader, waiter)
+            leader_result["design"] = "changed by leader"
+            waiter_result["design"] = "changed by waiter"
+
+            cached = await self.designer.design_protocol_using_introspection(self.request)
+            self.assertEqual(cached, {"design": "TestProtocol", "run": 1})
+            cached["design"] = "changed by cache hit"
+            again = await self.designer.design_protocol_using_introspection(self.request)
+            self.assertEqual(again["design"], "TestProtocol")
+            self.assertEqual(pipeline.runs, 1)
+
+        self.run_with_pipeline(scenario)
+
+    def test_cancelled_leader_hands_over_to_waiter(self):
+        """Test that a waiter reruns the design when the leader is cancelled"""
+        async def scenario(pipeline):
+            leader = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await pipeline.started.wait()
+            waiter = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await asyncio.sleep(0)
+
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            pipeline.release.set()
+
+            result = await waiter
+            self.assertEqual(result["run"], 2)
+            self.assertEqual(pipeline.runs, 2)
+            self.assertEqual(self.designer._inflight, {})
+
+        self.run_with_pipeline(scenario)
+
+    def test_pipeline_error_reaches_all_callers(self):
+        """Test that a failed design is raised to every caller and not cached"""
+        async def scenario(pipeline):
+            leader = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await pipeline.started.wait()
+            waiter = asyncio.create_task(self.designer.design_protocol_using_introspection(self.request))
+            await asyncio.sleep(0)
+            pipeline.release.set()
+
+            results = await asyncio.gather(leader, waiter, return_exceptions=True)
+            for result in results:
+                self.assertIsInstance(result, ValueError)
+            self.assertEqual(pipeline.runs, 1)
+            self.assertEqual(self.designer._inflight, {})
+            self.assertEqual(len(self.designer._design_result_cache), 0)
+
+        self.run_with_pipeline(scenario, error=ValueError("design failed"))
+
+    @patch.object(introspective_protocol_designer, "DESIGN_RESULT_CACHE_SIZE", 2)
+    def test_result_cache_evicts_least_recently_used(self):
+        """Test that the design-result cache keeps only the most recently used designs"""
+        async def scenario(pipeline):
+            pipeline.release.set()
+            requests = [{"name": f"Protocol{i}"} for i in range(3)]
+
+            await self.designer.design_protocol_using_introspection(requests[0])
+            await self.designer.design_protocol_using_introspection(requests[1])
+            # Touch the first design so the second becomes least recently used
+            await self.designer.design_protocol_using_introspection(requests[0])
+            await self.designer.design_protocol_using_introspection(requests[2])
+
+            cache = self.designer._design_result_cache
+            self.assertEqual(list(cache), [self.designer._design_request_key(requests[i]) for i in (0, 2)])
+            self.assertEqual(pipeline.runs, 3)
+
+        self.run_with_pipeline(scenario)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Unit tests for the Copilot ML department.
+Tests knowledge export, codebase analysis and deployment planning.
+"""
+
+import unittest
+import asyncio
+import json
+from unittest.mock import patch
+import sys
+import os
+
+# Add the ML department directory (not an importable package name) to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../enterprise/copilot-org/departments/ml-dept'))
+
+import specialization
+from specialization import CopilotMLDepartment
+
+
+class TestKnowledgeExport(unittest.TestCase):
+    """Test the department's knowledge exports"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ml_dept = CopilotMLDepartment({"industry": "technology"})
+        self.ml_dept.performance_baselines["latency"] = specialization.MappingProxyType({"p50_ms": 40})
+
+    def test_json_export_matches_dict_export(self):
+        """Test that the JSON export holds the same document as the dict export"""
+        # Pin the timestamp so both exports describe the same moment
+        with patch.object(specialization, "_export_timestamp", return_value="2024-01-01T00:00:00"):
+            expected = json.loads(json.dumps(self.ml_dept.export_department_knowledge(),
+                                             default=specialization._json_default))
+            exported = json.loads(self.ml_dept.export_department_knowledge_json())
+            with patch.object(specialization, "orjson", None):
+                fallback = json.loads(self.ml_dept.export_department_knowledge_json())
+
+        self.assertEqual(exported, expected)
+        self.assertEqual(fallback, expected)
+        self.assertEqual(exported["patterns"]["enterprise_transformer"]["name"],
+                         "Enterprise Transformer Architecture")
+
+    def test_exports_follow_pattern_changes(self):
+        """Test that changes to a registered pattern show up in both exports"""
+        pattern = self.ml_dept.specialized_patterns["enterprise_transformer"]
+        self.ml_dept.export_department_knowledge()
+
+        pattern.adoption_rate = 0.99
+        pattern.implementation["num_layers"] = 24
+
+        for export in (self.ml_dept.export_department_knowledge(),
+                       json.loads(self.ml_dept.export_department_knowledge_json())):
+            exported = export["patterns"]["enterprise_transformer"]
+            self.assertEqual(exported["adoption_rate"], 0.99)
+            self.assertEqual(exported["implementation"]["num_layers"], 24)
+
+    def test_pattern_exports_are_copies(self):
+        """Test that changing an export leaves the registered pattern untouched"""
+        exported = self.ml_dept.export_department_knowledge()["patterns"]["enterprise_transformer"]
+        exported["implementation"]["num_layers"] = 1
+
+        pattern = self.ml_dept.specialized_patterns["enterprise_transformer"]
+        self.assertEqual(pattern.implementation["num_layers"], 12)
+
+
+class TestCodebaseAnalysis(unittest.TestCase):
+    """Test enterprise codebase analysis"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ml_dept = CopilotMLDepartment()
+
+    def analyze(self, codebase_context):
+        """Run a codebase analysis"""
+        return asyncio.run(self.ml_dept.analyze_enterprise_codebase(codebase_context))
+
+    def test_known_patterns_are_reported_in_order(self):
+        """Test pattern identification, frequencies and optimization opportunities"""
+        analysis = self.analyze({
+            "codebase_features": ["model_serving_patterns", "unknown_feature", "transformer_usage"],
+            "pattern_frequencies": {"transformer_usage": 0.8}
+        })
+
+        patterns = analysis["identified_patterns"]
+        self.assertEqual([p["pattern_name"] for p in patterns], ["transformer_usage", "model_serving_patterns"])
+        self.assertEqual([p["frequency"] for p in patterns], [0.8, 0.1])
+        self.assertEqual([p["optimization_potential"] for p in patterns], [0.8, 0.9])
+        self.assertEqual([o["pattern"] for o in analysis["optimization_opportunities"]],
+                         ["transformer_usage", "model_serving_patterns"])
+        self.assertEqual(len(analysis["natural_language_insights"]), 4)
+
+    def test_compliance_is_assessed_without_patterns(self):
+        """Test that requirement-based compliance issues are reported for an empty codebase"""
+        analysis = self.analyze({"enterprise_requirements": {"max_latency_ms": 50, "data_privacy": True}})
+
+        self.assertEqual(analysis["identified_patterns"], [])
+        self.assertEqual(analysis["optimization_opportunities"], [])
+        self.assertEqual([issue["type"] for issue in analysis["enterprise_compliance"]["compliance_issues"]],
+                         ["performance", "privacy"])
+        self.assertEqual(analysis["natural_language_insights"][0],
+                         "Found 0 ML patterns in the enterprise codebase.")
+        self.assertEqual(analysis["natural_language_insights"][1], "Enterprise compliance score: 95.0%")
+
+
+
+class TestDeploymentStrategy(unittest.TestCase):
+    """Test the deployment strategy in architecture recommendations"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.ml_dept = CopilotMLDepartment()
+
+    def recommend(self, constraints):
+        """Return the recommended deployment strategy for the given constraints"""
+        recommendation = asyncio.run(self.ml_dept.recommend_enterprise_architecture(
+            {"domain": "code_understanding", "constraints": constraints}
+        ))
+        return recommendation["deployment_strategy"]
+
+    def test_strategy_is_plain_data_with_and_without_overrides(self):
+        """Test that both branches return JSON-serializable dicts and lists"""
+        for constraints in ({}, {"on_premise_only": True, "low_latency_required": True}):
+            strategy = self.recommend(constraints)
+            self.assertIs(type(strategy), dict)
+            self.assertIs(type(strategy["monitoring"]), dict)
+            self.assertIs(type(strategy["rollout_plan"]), list)
+            self.assertIs(type(strategy["monitoring"]["performance_metrics"]), list)
+            self.assertEqual(json.loads(json.dumps(strategy)), strategy)
+
+        self.assertEqual(strategy["deployment_type"], "on_premise")
+        self.assertTrue(strategy["edge_deployment"])
+
+    def test_strategies_are_not_shared(self):
+        """Test that changing one recommendation's strategy does not affect the next"""
+        strategy = self.recommend({})
+        strategy["monitoring"]["performance_metrics"].append("cost")
+        strategy["deployment_type"] = "edge"
+
+        fresh = self.recommend({})
+        self.assertEqual(fresh["deployment_type"], "hybrid")
+        self.assertEqual(fresh["monitoring"]["performance_metrics"], ["latency", "throughput", "accuracy"])
+
+
+if __name__ == '__main__':
+    unittest.main()
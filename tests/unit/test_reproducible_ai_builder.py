@@ -0,0 +1,361 @@
+"""
+Unit tests for the Guix-inspired reproducible AI build system.
+Tests build identities, caching, incremental builds and blueprint output.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+
+# Add the cognitive ecology directory (not an importable package name) to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../cognitive-ecology'))
+
+import reproducible_ai_builder
+from reproducible_ai_builder import ReproducibleAIBuilder
+
+
+MODEL_CONFIG = {
+    "architecture": "transformer",
+    "training_data": "test_corpus",
+    "hyperparameters": {"layers": 2, "learning_rate": 2e-5}
+}
+
+
+class TestBuildIdentity(unittest.TestCase):
+    """Test that build identities do not depend on the environment"""
+
+    def build_identities(self):
+        """Source hash, component key and manifest id of a small build"""
+        builder = ReproducibleAIBuilder()
+        component = builder.create_ml_model_component("test_model", MODEL_CONFIG)
+        component_key = reproducible_ai_builder._component_key(component)
+        manifest = builder.generate_build_manifest(
+            [component_key], {"target_name": "test_system", "learning_rate": 1e-4}, "2024-01-01T00:00:00+00:00"
+        )
+        return component.source_hash, component_key, manifest.manifest_id
+
+    def test_identities_are_pinned(self):
+        """Test that hashes do not drift between releases or environments"""
+        source_hash, component_key, manifest_id = self.build_identities()
+        self.assertEqual(source_hash, "be61ebea0c889de7be6d8890caeb6dbcf1cbc5bc23e86bd81f3a4757394ab292")
+        self.assertEqual(component_key, "test_model-1.0.0-be61ebea")
+        self.assertEqual(
+            manifest_id, "b2-4552dd44d5ab5bb16914e096dae1b4eb66a512a196e4489a639518f2aaae5f6f"
+        )
+
+    def test_source_hash_uses_canonical_stdlib_json(self):
+        """Test that the source hash is taken over sorted, compact stdlib JSON"""
+        source = {"b": 2e-5, "a": [1, "ü"]}
+        self.assertEqual(
+            reproducible_ai_builder._canonical_json(source),
+            '{"a":[1,"ü"],"b":2e-05}'.encode()
+        )
+
+    def test_interning_keeps_key_types_apart(self):
+        """Test that mappings differing only in key types are not shared"""
+        builder = ReproducibleAIBuilder()
+        int_keyed = builder.define_build_component("a", "1.0.0", {}, {"configuration": {1: "x"}})
+        str_keyed = builder.define_build_component("b", "1.0.0", {}, {"configuration": {"1": "x"}})
+        same_as_int = builder.define_build_component("c", "1.0.0", {}, {"configuration": {1: "x"}})
+
+        self.assertEqual(dict(int_keyed.configuration), {1: "x"})
+        self.assertEqual(dict(str_keyed.configuration), {"1": "x"})
+        self.assertIs(same_as_int.configuration, int_keyed.configuration)
+
+    def test_component_specs_keep_key_types_apart(self):
+        """Test that specs differing only in key types define distinct components"""
+        builder = ReproducibleAIBuilder()
+        int_keyed = builder.create_ml_model_component("test_model", dict(MODEL_CONFIG, validation={1: "a"}))
+        str_keyed = builder.create_ml_model_component("test_model", dict(MODEL_CONFIG, validation={"1": "a"}))
+        same_as_int = builder.create_ml_model_component("test_model", dict(MODEL_CONFIG, validation={1: "a"}))
+
+        self.assertIsNot(str_keyed, int_keyed)
+        self.assertEqual(dict(str_keyed.configuration["validation_requirements"]), {"1": "a"})
+        self.assertNotEqual(str_keyed._digest, int_keyed._digest)
+        self.assertIs(same_as_int, int_keyed)
+
+
+class TestPersistentBuildCache(unittest.TestCase):
+    """Test that a later run restores unchanged components and manifests"""
+
+    BUILD_CONFIG = {"target_name": "test_system"}
+
+    def setUp(self):
+        """Set up a writable store path for the on-disk cache"""
+        self.store = tempfile.TemporaryDirectory()
+        self.addCleanup(self.store.cleanup)
+
+    def run_build(self, model_config=MODEL_CONFIG):
+        """Define a model component and generate its manifest in a fresh builder"""
+        builder = ReproducibleAIBuilder(self.store.name, persistent_cache=True)
+        self.addCleanup(builder.close)
+        component = builder.create_ml_model_component("test_model", model_config)
+        manifest = builder.generate_build_manifest(
+            [reproducible_ai_builder._component_key(component)], self.BUILD_CONFIG, "2024-01-01T00:00:00+00:00"
+        )
+        return builder, component, manifest
+
+    def test_second_run_skips_recomputation(self):
+        """Test that an unchanged component and manifest are restored, not recomputed"""
+        _, first_component, first_manifest = self.run_build()
+
+        hash_component = patch.object(reproducible_ai_builder, "_hash_component",
+                                      wraps=reproducible_ai_builder._hash_component)
+        resolve = patch.object(ReproducibleAIBuilder, "_resolve_dependency_graph", autospec=True,
+                               side_effect=ReproducibleAIBuilder._resolve_dependency_graph)
+        with hash_component as hashed, resolve as resolved:
+            _, component, manifest = self.run_build()
+
+        hashed.assert_not_called()
+        resolved.assert_not_called()
+        self.assertEqual(component, first_component)
+        self.assertEqual(component._digest, first_component._digest)
+        self.assertEqual(manifest.manifest_id, first_manifest.manifest_id)
+        self.assertEqual(manifest.dependency_graph, first_manifest.dependency_graph)
+        self.assertEqual(manifest.verification_checksums, first_manifest.verification_checksums)
+
+    def test_cache_is_opt_in(self):
+        """Test that a writable store path alone does not create an on-disk cache"""
+        builder = ReproducibleAIBuilder(self.store.name)
+        builder.create_ml_model_component("test_model", MODEL_CONFIG)
+        self.assertIsNone(builder._persistent_cache)
+        self.assertEqual(os.listdir(self.store.name), [])
+
+    def test_restored_components_keep_their_content(self):
+        """Test that restored components hash to their stored digest and share interned values"""
+        self.run_build()
+        self.run_build(dict(MODEL_CONFIG, validation={1: "a"}))
+
+        builder = ReproducibleAIBuilder(self.store.name, persistent_cache=True)
+        self.addCleanup(builder.close)
+        component = builder.create_ml_model_component("test_model", MODEL_CONFIG)
+        int_keyed = builder.create_ml_model_component("test_model", dict(MODEL_CONFIG, validation={1: "a"}))
+
+        for restored in (component, int_keyed):
+            self.assertEqual(reproducible_ai_builder._hash_component(restored), restored._digest)
+        self.assertEqual(dict(int_keyed.configuration["validation_requirements"]), {1: "a"})
+        self.assertIs(int_keyed.environment_variables, component.environment_variables)
+        self.assertIs(int_keyed.build_inputs, component.build_inputs)
+
+    def test_changed_dependency_invalidates_manifest(self):
+        """Test that a manifest is regenerated when a component in its graph changed"""
+        def run(dependency_build_system):
+            builder = ReproducibleAIBuilder(self.store.name, persistent_cache=True)
+            self.addCleanup(builder.close)
+            dependency = builder.define_build_component(
+                "dependency", "1.0.0", {"source": "dep"}, {"build_system": dependency_build_system}
+            )
+            dependency_key = reproducible_ai_builder._component_key(dependency)
+            target = builder.define_build_component(
+                "target", "1.0.0", {"source": "target"}, {"inputs": [dependency_key]}
+            )
+            target_key = reproducible_ai_builder._component_key(target)
+            return builder.generate_build_manifest([target_key], self.BUILD_CONFIG), dependency
+
+        first_manifest, _ = run("make")
+        with patch.object(ReproducibleAIBuilder, "_resolve_dependency_graph", autospec=True,
+                          side_effect=ReproducibleAIBuilder._resolve_dependency_graph) as resolved:
+            manifest, dependency = run("cmake")
+
+        # Same component keys and targets, but the dependency's digest changed
+        resolved.assert_called_once()
+        self.assertEqual(manifest.dependency_graph, first_manifest.dependency_graph)
+        self.assertNotEqual(manifest.manifest_id, first_manifest.manifest_id)
+        self.assertIs(manifest.components[0], dependency)
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    """Test wave scheduling and incremental rebuilds"""
+
+    def setUp(self):
+        """Set up a writable store path so build results persist between builders"""
+        self.store = tempfile.TemporaryDirectory()
+        self.addCleanup(self.store.cleanup)
+
+    def define_graph(self, base_build_system="make"):
+        """Define base <- middle <- top plus an independent component, and their manifest"""
+        builder = ReproducibleAIBuilder(self.store.name, persistent_cache=True)
+        self.addCleanup(builder.close)
+        key = reproducible_ai_builder._component_key
+
+        base = builder.define_build_component("base", "1.0.0", {"source": "base"},
+                                              {"build_system": base_build_system})
+        middle = builder.define_build_component("middle", "1.0.0", {"source": "middle"},
+                                                {"inputs": [key(base)]})
+        top = builder.define_build_component("top", "1.0.0", {"source": "top"},
+                                             {"inputs": [key(middle)]})
+        independent = builder.define_build_component("independent", "1.0.0", {"source": "independent"}, {})
+
+        keys = {"base": key(base), "middle": key(middle), "top": key(top), "independent": key(independent)}
+        manifest = builder.generate_build_manifest([keys["top"], keys["independent"]], {})
+        return builder, manifest, keys
+
+    def test_waves_follow_dependency_order(self):
+        """Test that each wave only holds components whose dependencies are built"""
+        builder, manifest, keys = self.define_graph()
+
+        waves = [list(wave) for wave in builder._build_in_waves(manifest, {})]
+
+        self.assertEqual([set(wave) for wave in waves], [
+            {keys["base"], keys["independent"]},
+            {keys["middle"]},
+            {keys["top"]}
+        ])
+        # Results within a wave come in manifest order
+        manifest_order = [reproducible_ai_builder._component_key(component) for component in manifest.components]
+        self.assertEqual(waves[0], sorted(waves[0], key=manifest_order.index))
+
+    def test_affected_components_include_reverse_dependencies(self):
+        """Test that a changed component marks everything depending on it"""
+        builder, manifest, keys = self.define_graph()
+        self.assertEqual(builder.affected_components(manifest), set(keys.values()))
+        builder.execute_reproducible_build(manifest)
+        self.assertEqual(builder.affected_components(manifest), set())
+
+        # Same keys, but the base component's build procedure changed
+        builder, manifest, changed_keys = self.define_graph("cmake")
+        self.assertEqual(changed_keys, keys)
+        self.assertEqual(builder.affected_components(manifest),
+                         {keys["base"], keys["middle"], keys["top"]})
+
+    def test_incremental_build_restores_unaffected_components(self):
+        """Test that only affected components are rebuilt, by default"""
+        builder, manifest, keys = self.define_graph()
+        builder.execute_reproducible_build(manifest)
+
+        builder, manifest, _ = self.define_graph("cmake")
+        with patch.object(builder, "_build_component", wraps=builder._build_component) as build:
+            results = builder.execute_reproducible_build(manifest)
+
+        self.assertEqual(results["build_status"], "success")
+        self.assertEqual(build.call_count, 3)
+        self.assertTrue(results["component_results"][keys["independent"]]["cached"])
+        for name in ("base", "middle", "top"):
+            self.assertNotIn("cached", results["component_results"][keys[name]])
+
+    def test_versions_of_one_component_are_cached_separately(self):
+        """Test that two versions of a component keep their own build records"""
+        builder = ReproducibleAIBuilder(self.store.name, persistent_cache=True)
+        self.addCleanup(builder.close)
+        key = reproducible_ai_builder._component_key
+        versions = [
+            builder.define_build_component("model", version, {"source": version}, {})
+            for version in ("1.0.0", "2.0.0")
+        ]
+        manifest = builder.generate_build_manifest([key(component) for component in versions], {})
+
+        first = builder.execute_reproducible_build(manifest)
+        with patch.object(builder, "_build_component") as build:
+            second = builder.execute_reproducible_build(manifest)
+
+        build.assert_not_called()
+        self.assertEqual(set(first["component_results"]), {key(component) for component in versions})
+        self.assertEqual(set(second["component_results"]), set(first["component_results"]))
+        for result in second["component_results"].values():
+            self.assertTrue(result["cached"])
+
+
+
+class TestWriteBlueprint(unittest.TestCase):
+    """Test that blueprints are written the same way by both encoders"""
+
+    BLUEPRINT = {"system_name": "TestSystem", "checksums": {1: "a"}, "components": {"outputs": ["x", "y"]}}
+
+    def setUp(self):
+        """Set up an output directory"""
+        self.output = tempfile.TemporaryDirectory()
+        self.addCleanup(self.output.cleanup)
+
+    def write(self, **options):
+        """Write the test blueprint and return the file contents"""
+        path = os.path.join(self.output.name, "blueprint.json")
+        reproducible_ai_builder.write_blueprint(self.BLUEPRINT, path, **options)
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_stdlib_writes_indented_json_by_default(self):
+        """Test the default layout and string-converted keys without orjson"""
+        with patch.object(reproducible_ai_builder, "orjson", None):
+            data = self.write()
+        self.assertTrue(data.startswith(b'{\n  "system_name"'))
+        self.assertEqual(json.loads(data)["checksums"], {"1": "a"})
+
+    @unittest.skipIf(reproducible_ai_builder.orjson is None, "orjson is not installed")
+    def test_orjson_output_matches_stdlib(self):
+        """Test that orjson accepts non-string keys and writes the same bytes"""
+        for options in ({}, {"pretty": False}):
+            with patch.object(reproducible_ai_builder, "orjson", None):
+                expected = self.write(**options)
+            self.assertEqual(self.write(**options), expected)
+
+
+class TestLazyManifests(unittest.TestCase):
+    """Test that scenario manifests are only generated when requested"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.builder = ReproducibleAIBuilder()
+        model_key = reproducible_ai_builder._component_key(
+            self.builder.create_ml_model_component("test_model", MODEL_CONFIG)
+        )
+        self.blueprint = self.builder.create_ai_system_blueprint("TestSystem", {
+            "models": [dict(MODEL_CONFIG, name="test_model")],
+            "deployment_scenarios": {
+                "development": {"target_name": "dev_system", "components": [model_key]},
+                "production": {"target_name": "prod_system", "components": [model_key]}
+            }
+        })
+
+    def test_manifests_are_generated_on_first_access(self):
+        """Test that only the requested scenario's manifest is generated, once"""
+        manifests = self.blueprint["build_manifests"]
+        self.assertTrue(all(record.get("_lazy") for record in manifests.values()))
+
+        with patch.object(self.builder, "generate_build_manifest",
+                          wraps=self.builder.generate_build_manifest) as generate:
+            manifest = self.builder.get_manifest(self.blueprint, "development")
+            again = self.builder.get_manifest(self.blueprint, "development")
+
+        generate.assert_called_once()
+        self.assertIs(again, manifest)
+        self.assertEqual(manifests["development"]["manifest_id"], manifest.manifest_id)
+        self.assertEqual(manifest.target_name, "dev_system")
+        self.assertTrue(manifests["production"].get("_lazy"))
+
+    def test_pending_manifests_are_expanded_before_writing(self):
+        """Test that placeholders never reach a written blueprint"""
+        output = tempfile.TemporaryDirectory()
+        self.addCleanup(output.cleanup)
+        path = os.path.join(output.name, "blueprint.json")
+
+        with self.assertRaises(ValueError):
+            reproducible_ai_builder.write_blueprint(self.blueprint, path)
+
+        development = self.builder.get_manifest(self.blueprint, "development")
+        self.builder.expand_manifests(self.blueprint)
+        reproducible_ai_builder.write_blueprint(self.blueprint, path)
+        with open(path) as f:
+            written = json.load(f)["build_manifests"]
+
+        self.assertEqual(written["development"]["manifest_id"], development.manifest_id)
+        self.assertEqual(written["production"]["target_name"], "prod_system")
+        self.assertFalse(any("_lazy" in record for record in written.values()))
+
+    def test_saved_manifest_record_is_restored(self):
+        """Test that a generated manifest record rebuilds the same manifest in another builder"""
+        manifest = self.builder.get_manifest(self.blueprint, "development")
+
+        restored = ReproducibleAIBuilder().get_manifest(self.blueprint, "development")
+
+        self.assertIsNot(restored, manifest)
+        self.assertEqual(restored.manifest_id, manifest.manifest_id)
+        self.assertEqual(len(manifest.components), 1)
+        self.assertEqual(restored.components, manifest.components)
+        self.assertEqual(restored.verification_checksums, manifest.verification_checksums)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for the particle swarm kernels.
+Tests that the compiled swarm backends agree with the NumPy implementation.
+"""
+
+import unittest
+from unittest.mock import patch
+from datetime import datetime
+import sys
+import os
+
+import numpy as np
+
+# Add the project root and the forge examples directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../cogpilot-forge/cognitive-architecture/examples'))
+
+import cognitive_ecology_demo
+from cognitive_ecology_demo import ContextualMemoryPattern, OperationalizedRAGFabric
+import forge_demonstration
+
+try:
+    import pso_kernel  # Cython build, only present after `cythonize -i pso_kernel.pyx`
+except ImportError:
+    pso_kernel = None
+
+
+def _cython_swarm(positions, velocities, best_positions, best_scores,
+                  priorities, salience_score, n_iterations):
+    """The Cython kernel with the demo's swarm coefficients, as the demo wraps it"""
+    demo = cognitive_ecology_demo
+    return pso_kernel.fused_swarm(positions, velocities, best_positions, best_scores,
+                                  priorities, salience_score, n_iterations, demo.INERTIA_WEIGHT,
+                                  demo.COGNITIVE_WEIGHT, demo.SOCIAL_WEIGHT, demo.SALIENCE_WEIGHT,
+                                  demo.CONVERGENCE_TOLERANCE, demo.CONVERGENCE_PATIENCE)
+
+
+class TestFusedSwarmParity(unittest.TestCase):
+    """Test that the Numba and Cython fused swarms match the NumPy swarm"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.fabric = OperationalizedRAGFabric()
+        self.pattern = ContextualMemoryPattern(
+            pattern_id="test_pattern",
+            priority_profile={"dim_0": 0.9, "dim_5": 0.4, "ml_architecture": 0.2},
+            execution_trace=[],
+            embedding_vector=None,
+            salience_score=0.7,
+            organization_context="test_org"
+        )
+
+    def encode_with(self, backend):
+        """Encode the test pattern with the given fused swarm (None for NumPy)"""
+        with patch.object(cognitive_ecology_demo, "_fused_swarm", backend):
+            return self.fabric.particle_swarm_optimize(self.pattern, self.pattern.priority_vector())
+
+    @unittest.skipIf(cognitive_ecology_demo.njit is None, "Numba is not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the Numba kernel finds the same encoding as NumPy"""
+        np.testing.assert_allclose(self.encode_with(cognitive_ecology_demo._fused_swarm),
+                                   self.encode_with(None), atol=1e-6)
+
+    @unittest.skipIf(pso_kernel is None, "pso_kernel has not been built with Cython")
+    def test_cython_matches_numpy(self):
+        """Test that the Cython kernel finds the same encoding as NumPy"""
+        np.testing.assert_allclose(self.encode_with(_cython_swarm), self.encode_with(None), atol=1e-6)
+
+
+
+class TestForgeSwarmParity(unittest.TestCase):
+    """Test that the forge's batched Numba swarm matches its NumPy swarm"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.architecture = forge_demonstration.CogpilotCognitiveArchitecture()
+        self.patterns = [
+            forge_demonstration.ContextualMemoryPattern(
+                pattern_id=f"test_pattern_{i}",
+                priority_profile={"dim_0": 0.9, "dim_3": 0.1 * i, "protocol_design": 0.2},
+                execution_trace=[],
+                embedding_vector=None,
+                salience_score=0.3 * i,
+                organization_context="test_org",
+                created_at=datetime(2024, 1, 1)
+            )
+            for i in range(3)
+        ]
+
+    def optimize_with(self, kernel):
+        """Optimize the test patterns with a fixed seed and the given kernel (None for NumPy)"""
+        with patch.object(forge_demonstration, "_swarm_rng", lambda: np.random.default_rng(7)), \
+                patch.object(forge_demonstration, "_load_pso_kernel", lambda: kernel):
+            return np.stack(self.architecture._particle_swarm_optimize_batch(self.patterns))
+
+    def test_numba_matches_numpy(self):
+        """Test that the Numba kernel finds the same embeddings as NumPy"""
+        kernel = forge_demonstration._load_pso_kernel()
+        if kernel is None:
+            self.skipTest("Numba is not installed")
+        # float32 scoring in NumPy vs float64 accumulation in the kernel
+        np.testing.assert_allclose(self.optimize_with(kernel), self.optimize_with(None), atol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()